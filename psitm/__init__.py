@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+Importable helpers behind the Psi-TM notebooks and scripts.
+
+Subpackages:
+- psitm.sim: stress_firebreak sweep engine (stress_matrix, phase_weird)
+- psitm.lk: L_k pointer-chase tables, fooling-family counts and Lkphase transcript hashing
+- psitm.check: single-walk project index for the LaTeX/Lean checkers
+- psitm.proof: proof DAG and loss-expression algebra
+- psitm.antisim: anti-simulation budget-violation ratio and threshold over (k, n, beta) grids
+- psitm.commands: the checkers and table tools behind `python -m psitm` (psitm.cli)
+"""
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""`python -m psitm` entry point (see psitm.cli)."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Vectorized analysis for the anti-simulation hook (budget-violation ratio and threshold)."""
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Budget-violation ratio of the anti-simulation hook over (k, n, beta) grids.
+
+- A depth-(k-1) simulation making s = n^beta calls spends s*B(k-1,n) bits
+  against one iota_k call's B(k,n); with B(d,n) = c*d*log2 n the constant c
+  and log2 n cancel and the ratio is n^beta * (k-1)/k
+- log2_ratio evaluates beta*log2 n + log2((k-1)/k) for broadcastable k,
+  log2 n and beta in one NumPy expression; n enters only through log2 n,
+  so n up to 2^64 and beyond never overflows, and log2((k-1)/k) goes
+  through log1p, so large k keeps its precision
+- ratio_grid broadcasts 1-d axes into the full (k, log2 n, beta) tensor
+- threshold_beta solves ratio = 1 in closed form for arrays of (k, log2 n):
+  beta* = log2(k/(k-1)) / log2 n = ln(k/(k-1)) / ln n
+- budget_table / threshold_table flatten the tensors in C order (k
+  slowest); write_budget exports them with psitm.sim.columnar.write_table
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..sim.columnar import write_table
+
+TABLE_NAME = "anti_simulation_budget"
+THRESHOLD_NAME = "anti_simulation_threshold"
+
+
+def _check(k: np.ndarray, log2_n: np.ndarray) -> None:
+    if np.any(k < 2):
+        raise ValueError("the budget ratio needs k >= 2")
+    if np.any(log2_n <= 0):
+        raise ValueError("the budget ratio needs n > 1 (log2 n > 0)")
+
+
+def log2_depth_factor(k) -> np.ndarray:
+    """log2((k-1)/k) = log2 B(k-1,n)/B(k,n), accurate for large k."""
+    k = np.asarray(k, dtype=float)
+    return np.log1p(-1.0 / k) / np.log(2.0)
+
+
+def log2_ratio(k, log2_n, beta) -> np.ndarray:
+    """log2 of s*B(k-1,n)/B(k,n) with s = n^beta, broadcast over k, log2 n and beta."""
+    k = np.asarray(k, dtype=float)
+    log2_n = np.asarray(log2_n, dtype=float)
+    _check(k, log2_n)
+    return np.asarray(beta, dtype=float) * log2_n + log2_depth_factor(k)
+
+
+def ratio_grid(ks, log2_ns, betas) -> np.ndarray:
+    """log2 ratio tensor of shape (len(ks), len(log2_ns), len(betas))."""
+    ks, log2_ns, betas = (np.asarray(a, dtype=float).ravel() for a in (ks, log2_ns, betas))
+    return log2_ratio(ks[:, None, None], log2_ns[None, :, None], betas[None, None, :])
+
+
+def threshold_beta(k, log2_n) -> np.ndarray:
+    """beta at which the ratio reaches 1, for broadcastable k and log2 n."""
+    k = np.asarray(k, dtype=float)
+    log2_n = np.asarray(log2_n, dtype=float)
+    _check(k, log2_n)
+    return -log2_depth_factor(k) / log2_n
+
+
+def budget_table(ks, log2_ns, betas) -> pd.DataFrame:
+    """One row per (k, log2 n, beta) with log2_ratio and violated = ratio >= 1."""
+    ks, log2_ns, betas = (np.asarray(a, dtype=float).ravel() for a in (ks, log2_ns, betas))
+    lr = ratio_grid(ks, log2_ns, betas)
+    k, log2_n, beta = (m.ravel() for m in np.meshgrid(ks, log2_ns, betas, indexing="ij"))
+    return pd.DataFrame({
+        "k": k.astype(np.int64),
+        "log2_n": log2_n,
+        "beta": beta,
+        "log2_ratio": lr.ravel(),
+        "violated": (lr.ravel() >= 0).astype(np.int64),
+    })
+
+
+def threshold_table(ks, log2_ns) -> pd.DataFrame:
+    """One row per (k, log2 n) with the closed-form threshold beta."""
+    ks, log2_ns = (np.asarray(a, dtype=float).ravel() for a in (ks, log2_ns))
+    k, log2_n = (m.ravel() for m in np.meshgrid(ks, log2_ns, indexing="ij"))
+    return pd.DataFrame({
+        "k": k.astype(np.int64),
+        "log2_n": log2_n,
+        "beta_threshold": threshold_beta(k, log2_n),
+    })
+
+
+def write_budget(out_dir: Path, ks, log2_ns, betas, formats=("csv",)) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Write anti_simulation_budget.<fmt> and anti_simulation_threshold.<fmt>; returns both tables."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    grid = budget_table(ks, log2_ns, betas)
+    thr = threshold_table(ks, log2_ns)
+    for fmt in formats:
+        write_table(grid, out_dir / TABLE_NAME, fmt)
+        write_table(thr, out_dir / THRESHOLD_NAME, fmt)
+    return grid, thr
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Shared scanning for the project checkers (check_project, validate_claims, arxiv_asset_check)."""
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk cache of per-file extraction records for the project checkers.
+
+- One JSON index per tree under <root>/.cache/psitm-check/index.json, keyed
+  by the file path relative to root; tree_cache_dir keeps the index of a
+  foreign tree (arxiv_asset_check --root) under this repo's .cache instead,
+  so checking a tree never writes into it
+- An entry holds the file's kind (tex/lean), mtime_ns, size, SHA-256 and the
+  record extract_tex/extract_lean produced for it
+- Lookup: a (mtime_ns, size) match reuses the record without reading the
+  file; otherwise the file is read and hashed, and a SHA-256 match with the
+  same size still reuses the record (touch, checkout, copy). Only files whose
+  content changed are parsed again (possibly in parallel, see ProjectIndex)
+- Entries carry EXTRACT_VERSION; bump it whenever extraction output changes
+- Saved atomically (tmp file + os.replace) and only when something changed
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+CACHE_DIR = Path(".cache") / "psitm-check"
+EXTRACT_VERSION = 2
+
+
+def decode_text(data: bytes) -> str:
+    """bytes -> str exactly as Path.read_text(encoding="utf-8", errors="ignore") would return."""
+    return data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def tree_cache_dir(root: Path, home: Path) -> Path:
+    """Cache directory for the tree at root, kept under home/.cache/psitm-check/.
+
+    home's own tree uses the default location; any other tree gets
+    trees/<SHA-256 of its resolved path, 16 hex digits>/.
+    """
+    root, home = Path(root).resolve(), Path(home).resolve()
+    if root == home:
+        return home / CACHE_DIR
+    return home / CACHE_DIR / "trees" / hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+
+
+class ExtractCache:
+    """Per-file extraction records of one tree, persisted as a JSON index."""
+
+    def __init__(self, root: Path, cache_dir: Path | None = None):
+        self.root = Path(root)
+        self.path = (self.root / CACHE_DIR if cache_dir is None else Path(cache_dir)) / "index.json"
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        self.misses = 0
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == EXTRACT_VERSION:
+                self.entries = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _key(self, p: Path) -> str:
+        try:
+            return p.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(p)
+
+    def extract(self, paths: list[Path], kind: str,
+                run: Callable[[list[Path], list[str | None]], list[tuple[str, dict | None]]]) -> dict[Path, dict]:
+        """{path: record} for paths.
+
+        run(changed, known) is called once with the files whose (mtime_ns, size)
+        did not match and the SHA-256 each may still have (None if unknown); it
+        returns (sha256, record), with record None when the hash matched.
+        """
+        hits: dict[Path, dict] = {}
+        changed: list[Path] = []
+        known: list[str | None] = []
+        stats = {}
+        for p in paths:
+            st = p.stat()
+            stats[p] = st
+            entry = self.entries.get(self._key(p))
+            usable = entry is not None and entry["kind"] == kind and entry["size"] == st.st_size
+            if usable and entry["mtime_ns"] == st.st_mtime_ns:
+                hits[p] = entry["record"]
+            else:
+                changed.append(p)
+                known.append(entry["sha256"] if usable else None)
+        for p, (digest, record) in zip(changed, run(changed, known)):
+            key, st = self._key(p), stats[p]
+            if record is None:
+                record = self.entries[key]["record"]
+            else:
+                self.misses += 1
+            self.entries[key] = {
+                "kind": kind, "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                "sha256": digest, "record": record,
+            }
+            hits[p] = record
+            self.dirty = True
+        keys = {self._key(p) for p in paths}
+        stale = [k for k, e in self.entries.items() if e["kind"] == kind and k not in keys]
+        for k in stale:
+            del self.entries[k]
+        self.dirty |= bool(stale)
+        return {p: hits[p] for p in paths}
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": EXTRACT_VERSION, "files": self.entries}), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.dirty = False
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+paper/claims.yaml as one index shared by the checkers and validators.
+
+- load_claims parses the YAML once (libyaml when available, see
+  psitm.yamlio); with a cache root the parsed list is also kept as a JSON
+  snapshot (<root>/.cache/psitm-check/claims.json) keyed by the file's
+  SHA-256, so unchanged claims are not parsed again; within one process the
+  index of unchanged bytes is reused outright (commands run together by
+  `python -m psitm` share it)
+- ClaimsIndex keeps the raw entries plus dict lookups latex -> lean and
+  lean -> latex (first entry wins for duplicates), the lean IDs of every
+  mapping entry, and the structural problems validate_claims reports
+  (non-mapping entries, missing latex/lean, duplicate labels or IDs)
+- join checks any subset of the other artifacts against the claims in
+  one pass each: Lean `-- ID:` headers, theorem labels, proof-DAG nodes,
+  bridge ReferenceLemmas and relaxation IDs; it returns every gap at once
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+from .cache import CACHE_DIR
+
+SNAPSHOT_NAME = "claims.json"
+
+_LOADED: dict[tuple[Path, str], ClaimsIndex] = {}
+
+
+def load_yaml(text: str):
+    from ..yamlio import safe_load  # PyYAML is imported only when the snapshot is stale
+
+    return safe_load(text)
+
+
+class ClaimsIndex:
+    """Entries of claims.yaml with O(1) latex <-> lean lookups."""
+
+    def __init__(self, data, path: Path | None = None, sha256: str | None = None):
+        self.data = data
+        self.path = path
+        self.sha256 = sha256
+        self.latex_to_lean: dict = {}
+        self.lean_to_latex: dict = {}
+        self.lean_ids: set = set()
+        self.problems: list[str] = []
+        if not isinstance(data, list):
+            self.problems.append("claims.yaml must be a list of mappings")
+            return
+        for i, entry in enumerate(data):
+            if not isinstance(entry, dict):
+                self.problems.append(f"Entry {i} is not a mapping")
+                continue
+            latex, lean = entry.get("latex"), entry.get("lean")
+            if lean:
+                self.lean_ids.add(lean)
+            if not latex or not lean:
+                self.problems.append(f"Entry {i} missing 'latex' or 'lean': {entry}")
+                continue
+            if latex in self.latex_to_lean:
+                self.problems.append(f"Duplicate LaTeX label: {latex}")
+            if lean in self.lean_to_latex:
+                self.problems.append(f"Duplicate Lean ID: {lean}")
+            self.latex_to_lean.setdefault(latex, lean)
+            self.lean_to_latex.setdefault(lean, latex)
+
+    def __len__(self) -> int:
+        return len(self.latex_to_lean)
+
+    def lean(self, latex: str):
+        return self.latex_to_lean.get(latex)
+
+    def latex(self, lean: str):
+        return self.lean_to_latex.get(lean)
+
+    def join(self, lean_headers: Iterable[str] | None = None, labels: Iterable[str] | None = None,
+             dag_nodes: Iterable[str] | None = None, bridge_refs: Iterable[str] | None = None,
+             relax_ids: Iterable[str] | None = None) -> dict[str, list[str]]:
+        """Sorted coverage gaps for each artifact given.
+
+        lean:   claimed Lean IDs without a `-- ID:` header in lean_headers
+        labels: labels (already filtered to the ones that need a claim) not in claims
+        dag / bridges / relax: IDs used by those tables that no claim declares
+        """
+        gaps: dict[str, list[str]] = {}
+        if lean_headers is not None:
+            declared = lean_headers if isinstance(lean_headers, (set, frozenset, dict)) else set(lean_headers)
+            gaps["lean"] = sorted(i for i in self.lean_to_latex if i not in declared)
+        for key, ids, known in (("labels", labels, self.latex_to_lean), ("dag", dag_nodes, self.lean_ids),
+                                ("bridges", bridge_refs, self.lean_ids), ("relax", relax_ids, self.lean_ids)):
+            if ids is not None:
+                gaps[key] = sorted({i for i in ids if i not in known})
+        return gaps
+
+
+def _snapshot(cache_root: Path) -> Path:
+    return Path(cache_root) / CACHE_DIR / SNAPSHOT_NAME
+
+
+def load_claims(path: Path, cache_root: Path | None = None) -> ClaimsIndex:
+    """ClaimsIndex of path; with cache_root, reuse/update the JSON snapshot there."""
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    key = (path.resolve(), digest)
+    if key in _LOADED:
+        return _LOADED[key]
+    _LOADED[key] = index = _load(path, raw, digest, cache_root)
+    return index
+
+
+def _load(path: Path, raw: bytes, digest: str, cache_root: Path | None) -> ClaimsIndex:
+    snap = _snapshot(cache_root) if cache_root is not None else None
+    if snap is not None:
+        try:
+            cached = json.loads(snap.read_text(encoding="utf-8"))
+            if cached.get("sha256") == digest:
+                return ClaimsIndex(cached["data"], path, digest)
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+    data = load_yaml(raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"))
+    if snap is not None:
+        try:
+            text = json.dumps({"sha256": digest, "data": data})
+        except (TypeError, ValueError):  # dates etc. do not survive JSON; parse every time
+            text = None
+        if text is not None and json.loads(text)["data"] == data:
+            snap.parent.mkdir(parents=True, exist_ok=True)
+            tmp = snap.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, snap)
+    return ClaimsIndex(data, path, digest)
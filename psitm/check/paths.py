@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Directory-listing cache for figure path resolution.
+
+- DirCache lists each directory once (os.scandir) and answers exists() from
+  that listing instead of one stat() per candidate path
+- resolve(p) is resolve(p.parent) / p.name with the parent resolution
+  memoized per directory; for a name that is not a symlink this is exactly
+  what p.resolve() returns
+- Anything the listing cannot answer exactly falls back to the real syscall:
+  symlinked names, names that only match case-insensitively (case-folding
+  filesystems) and directories that cannot be listed (no read permission)
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+
+class Listing(NamedTuple):
+    names: frozenset[str]
+    links: frozenset[str]   # names that are symlinks
+    folded: frozenset[str]  # casefolded names
+
+
+class DirCache:
+    """exists()/resolve() for many paths with one scandir per directory."""
+
+    def __init__(self):
+        self._listings: dict[Path, Listing | None] = {}
+        self._dirs: dict[Path, Path] = {}
+        self.listed = 0  # scandir calls made
+
+    def listing(self, d: Path) -> Listing | None:
+        """Entries of d (empty if d is missing or not a directory); None if d cannot be listed."""
+        if d in self._listings:
+            return self._listings[d]
+        names, links = set(), set()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    names.add(e.name)
+                    if e.is_symlink():
+                        links.add(e.name)
+            listing = Listing(frozenset(names), frozenset(links), frozenset(n.casefold() for n in names))
+        except (FileNotFoundError, NotADirectoryError):
+            listing = Listing(frozenset(), frozenset(), frozenset())
+        except OSError:
+            listing = None
+        self.listed += 1
+        self._listings[d] = listing
+        return listing
+
+    def _exact(self, p: Path) -> Listing | None:
+        """Listing of p's directory if it answers for p.name without a syscall, else None."""
+        name = p.name
+        if not name or name == "..":
+            return None
+        listing = self.listing(p.parent)
+        if listing is None or name in listing.links:
+            return None
+        if name not in listing.names and name.casefold() in listing.folded:
+            return None
+        return listing
+
+    def exists(self, p: Path) -> bool:
+        listing = self._exact(p)
+        if listing is None:
+            return p.exists()
+        return p.name in listing.names
+
+    def resolve(self, p: Path) -> Path:
+        """Same as p.resolve()."""
+        if self._exact(p) is None:
+            return p.resolve()
+        parent = p.parent
+        d = self._dirs.get(parent)
+        if d is None:
+            d = self._dirs[parent] = parent.resolve()
+        return d / p.name
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Single-walk project index shared by the project checkers.
+
+- scan_project walks the tree once (os.walk, top-down, pruning IGNORED_DIRS)
+  and records every file in walk order; for the same tree this is the order
+  Path.rglob yields, so reports keep their file order
+- Per-file extraction is lazy and runs once per kind:
+  - .tex: one psitm.check.latex.tokenize pass; \\label, \\ref and
+    \\includegraphics anywhere (check_project), \\includegraphics and
+    \\graphicspath dirs outside % comments (arxiv_asset_check)
+  - .lean under lean/: `-- ID: <Token>` headers
+- Checkers query the index (tex_files, images, labels, refs, graphics,
+  lean_ids) instead of walking and re-reading files themselves
+- Extraction of the files that need it fans out over a process pool with
+  jobs > 1; results are merged back in walk order, so reports do not depend
+  on jobs
+- With cache=True, records persist in <root>/.cache/psitm-check/, or in
+  cache_dir when given (see psitm.check.cache), and only files whose
+  mtime/size/hash changed are re-read
+- refresh re-walks the tree and re-extracts only added or changed files of
+  the kinds already loaded (used by check_project.py --watch)
+- shared_index memoizes scan_project per process, so checkers run together
+  by `python -m psitm check` walk the tree and extract each file once
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from functools import cached_property
+from pathlib import Path
+
+from .cache import CACHE_DIR, ExtractCache, decode_text
+from .latex import tokenize
+
+IGNORED_DIRS = {".git", ".venv", "venv", "_build", "build", "out", "dist", "__pycache__"}
+
+LEAN_ID_RE = re.compile(r"^--\s*ID:\s*([^\s]+)\s*$", re.MULTILINE)
+BRACED_DIR_RE = re.compile(r"""\{([^}]+)\}""")
+
+
+def extract_tex(text: str) -> dict:
+    """Labels, refs and graphics from the raw text; includes and graphicspath dirs outside comments."""
+    rec: dict[str, list[str]] = {"labels": [], "refs": [], "graphics": [], "includes": [], "graphicspaths": []}
+    for tok in tokenize(text):
+        if tok.kind == "label":
+            rec["labels"].append(tok.value)
+        elif tok.kind == "ref":
+            rec["refs"].append(tok.value)
+        elif tok.kind == "graphics":
+            rec["graphics"].append(tok.value)
+            if not tok.commented:
+                rec["includes"].append(tok.value.strip())
+        elif not tok.commented:
+            for dm in BRACED_DIR_RE.finditer(tok.value):
+                raw = dm.group(1).strip()
+                if raw:
+                    rec["graphicspaths"].append(raw)
+    return rec
+
+
+def extract_lean(text: str) -> dict:
+    return {"ids": LEAN_ID_RE.findall(text)}
+
+
+EXTRACTORS = {"tex": extract_tex, "lean": extract_lean}
+
+
+def extract_file(kind: str, p: Path, known: str | None = None) -> tuple[str, dict | None]:
+    """(SHA-256 of the file bytes, EXTRACTORS[kind] record); record is None if the hash equals known."""
+    data = p.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known:
+        return digest, None
+    return digest, EXTRACTORS[kind](decode_text(data))
+
+
+def _extract_shard(args: tuple[str, list[Path], list[str | None]]) -> list[tuple[str, dict | None]]:
+    kind, paths, known = args
+    return [extract_file(kind, p, h) for p, h in zip(paths, known)]
+
+
+def walk(root: Path) -> list[Path]:
+    """Every file under root in top-down walk order, skipping IGNORED_DIRS."""
+    root = Path(root)
+    if any(part in IGNORED_DIRS for part in root.parts):
+        return []
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+        base = Path(dirpath)
+        files.extend(base / name for name in filenames)
+    return files
+
+
+class ProjectIndex:
+    """Files of one tree plus their extracted LaTeX and Lean records (keyed by path, walk order)."""
+
+    def __init__(self, root: Path, files: list[Path], lean_dir: str = "lean",
+                 cache: ExtractCache | None = None, jobs: int = 1):
+        self.root = Path(root)
+        self.files = files
+        self.lean_root = self.root / lean_dir
+        self.cache = cache
+        self.jobs = jobs
+        self.stamps: dict[Path, tuple[int, int]] = {}  # (mtime_ns, size) when last extracted
+
+    def tex_files(self) -> list[Path]:
+        return [p for p in self.files if p.name.endswith(".tex")]
+
+    def lean_files(self) -> list[Path]:
+        return [p for p in self.files if p.name.endswith(".lean") and self.lean_root in p.parents]
+
+    def images(self, exts) -> list[Path]:
+        """Files whose name ends with one of exts, in walk order."""
+        exts = tuple(exts)
+        return [p for p in self.files if p.name.endswith(exts)]
+
+    def _run(self, kind: str, paths: list[Path], known: list[str | None]) -> list[tuple[str, dict | None]]:
+        """extract_file over paths, in order; contiguous shards per worker when jobs > 1."""
+        if self.jobs <= 1 or len(paths) < 2:
+            return _extract_shard((kind, paths, known))
+        step = -(-len(paths) // (self.jobs * 4))
+        shards = [(kind, paths[i:i + step], known[i:i + step]) for i in range(0, len(paths), step)]
+        from concurrent.futures import ProcessPoolExecutor  # only needed with --jobs
+        with ProcessPoolExecutor(max_workers=self.jobs) as ex:
+            return [r for part in ex.map(_extract_shard, shards) for r in part]
+
+    def _stamp(self, paths: list[Path]) -> None:
+        for p in paths:
+            st = p.stat()
+            self.stamps[p] = (st.st_mtime_ns, st.st_size)
+
+    def _extract(self, paths: list[Path], kind: str) -> dict[Path, dict]:
+        self._stamp(paths)
+        if self.cache is None:
+            return {p: rec for p, (_, rec) in zip(paths, self._run(kind, paths, [None] * len(paths)))}
+        records = self.cache.extract(paths, kind, lambda changed, known: self._run(kind, changed, known))
+        self.cache.save()
+        return records
+
+    @cached_property
+    def tex(self) -> dict[Path, dict]:
+        return self._extract(self.tex_files(), "tex")
+
+    @cached_property
+    def lean(self) -> dict[Path, dict]:
+        return self._extract(self.lean_files(), "lean")
+
+    def refresh(self) -> list[Path]:
+        """Re-walk; re-extract added/changed files of loaded kinds. Returns added, changed and removed paths."""
+        self.files = walk(self.root)
+        changed: list[Path] = []
+        for kind, paths in (("tex", self.tex_files()), ("lean", self.lean_files())):
+            if kind not in self.__dict__:
+                continue
+            old = self.__dict__[kind]
+            stale, present = [], []
+            for p in paths:
+                try:
+                    st = p.stat()
+                except OSError:  # deleted since the walk
+                    continue
+                present.append(p)
+                if self.stamps.get(p) != (st.st_mtime_ns, st.st_size):
+                    stale.append(p)
+            paths = present
+            current = set(paths)
+            removed = [p for p in old if p not in current]
+            if not stale and not removed:
+                continue
+            for p in removed:
+                self.stamps.pop(p, None)
+            if self.cache is not None:
+                records = self._extract(paths, kind)
+            else:
+                self._stamp(stale)
+                fresh = {p: rec for p, (_, rec) in zip(stale, self._run(kind, stale, [None] * len(stale)))}
+                records = {p: fresh[p] if p in fresh else old[p] for p in paths}
+            self.__dict__[kind] = records
+            changed += stale + removed
+        return changed
+
+    def labels(self) -> set[str]:
+        return {label for rec in self.tex.values() for label in rec["labels"]}
+
+    def refs(self) -> set[str]:
+        return {ref for rec in self.tex.values() for ref in rec["refs"]}
+
+    def graphics(self) -> list[tuple[Path, str]]:
+        return [(tex, raw) for tex, rec in self.tex.items() for raw in rec["graphics"]]
+
+    def lean_ids(self, recursive: bool = True) -> set[str]:
+        """IDs from lean/**/*.lean, or only lean/*.lean with recursive=False."""
+        return {
+            i for p, rec in self.lean.items()
+            if recursive or p.parent == self.lean_root
+            for i in rec["ids"]
+        }
+
+
+def scan_project(root: Path, lean_dir: str = "lean", cache: bool = False, jobs: int = 1,
+                 cache_dir: Path | None = None) -> ProjectIndex:
+    """Index of root; cache=True reuses per-file records from cache_dir (default <root>/.cache/psitm-check/)."""
+    return ProjectIndex(root, walk(root), lean_dir, ExtractCache(root, cache_dir) if cache else None, jobs)
+
+
+_SHARED: dict[tuple[Path, str, Path | None], ProjectIndex] = {}
+
+
+def shared_index(root: Path, lean_dir: str = "lean", cache: bool = False, jobs: int = 1,
+                 cache_dir: Path | None = None) -> ProjectIndex:
+    """scan_project, memoized per (root, lean_dir, cache location) for the life of the process."""
+    root = Path(root).resolve()
+    where = (Path(cache_dir) if cache_dir is not None else root / CACHE_DIR).resolve() if cache else None
+    key = (root, lean_dir, where)
+    index = _SHARED.get(key)
+    if index is None:
+        index = _SHARED[key] = scan_project(root, lean_dir, cache, jobs, cache_dir)
+    index.jobs = max(index.jobs, jobs)
+    return index
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Change notification for `check_project.py --watch`.
+
+- watch_changes yields, after each batch of edits, the paths that
+  ProjectIndex.refresh re-extracted or dropped, any changed `extra` files and
+  the files with an `assets` suffix (figures) that appeared or disappeared,
+  together with the perf_counter time taken before the refresh
+- With watchdog installed (inotify/FSEvents/ReadDirectoryChangesW) the loop
+  sleeps until a file event arrives; otherwise it polls every `interval`
+  seconds (re-walk + stat of .tex/.lean files)
+"""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from .scan import ProjectIndex
+
+try:
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+    from watchdog.observers import Observer  # type: ignore
+except ImportError:  # optional dependency; fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+DEBOUNCE = 0.05  # seconds to let an editor finish writing before refreshing
+
+
+def _stamp(p: Path) -> tuple[int, int] | None:
+    try:
+        st = p.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _Wake(FileSystemEventHandler):
+    def __init__(self, event: threading.Event):
+        super().__init__()
+        self.event = event
+
+    def on_any_event(self, event) -> None:
+        self.event.set()
+
+
+def watch_changes(index: ProjectIndex, extra=(), interval: float = 0.5, poll: bool = False, assets=()):
+    """Yield (refresh start, changed paths) forever (until the caller stops iterating)."""
+    wake = threading.Event()
+    observer = None
+    if Observer is not None and not poll:
+        observer = Observer()
+        observer.schedule(_Wake(wake), str(index.root), recursive=True)
+        observer.start()
+    stamps = {Path(p): _stamp(Path(p)) for p in extra}
+    present = set(index.images(assets)) if assets else set()
+    try:
+        while True:
+            if observer is not None:
+                wake.wait()
+                time.sleep(DEBOUNCE)
+                wake.clear()
+            else:
+                time.sleep(interval)
+            t0 = time.perf_counter()
+            changed = index.refresh()
+            for p, old in stamps.items():
+                new = _stamp(p)
+                if new != old:
+                    stamps[p] = new
+                    changed.append(p)
+            if assets:
+                now = set(index.images(assets))
+                changed += sorted(now ^ present)
+                present = now
+            if changed:
+                yield t0, changed
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+`python -m psitm`: the project checkers and proof-table tools as one multi-command CLI.
+
+Usage:
+  python -m psitm check [--no-cache] [--jobs N]       # what `make check` runs
+  python -m psitm claims --dag paper/proof_dag.csv
+  python -m psitm claims + dag --csv paper/proof_dag.csv + bridges --csv B --claims C
+
+- COMMANDS maps each subcommand to a module of psitm.commands; the module is
+  imported only when its command runs, so `claims` never loads matplotlib
+  and listing the commands imports nothing
+- Arguments after the command name go to that module's main(argv) unchanged;
+  the scripts under scripts/ (and arxiv_asset_check.py) are thin wrappers
+  that call the same main, so both spellings take the same options
+- "+" chains several commands in one interpreter; `check` is the chain
+  assets + claims + project. Chained commands share the project walk and
+  per-file records (psitm.check.scan.shared_index) and the parsed claims
+  (psitm.check.claims.load_claims)
+- The exit status is the largest status of the commands run
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+
+COMMANDS = {
+    "assets": ("arxiv_asset_check", "Unused and missing figures (arxiv_asset_check.py)"),
+    "claims": ("validate_claims", "claims.yaml structure and Lean `-- ID:` headers (validate_claims.py)"),
+    "project": ("check_project", "Refs, theorem labels, Lean IDs and figure paths (check_project.py)"),
+    "dag": ("validate_dag", "proof_dag.csv losses and acyclicity, DOT cycles (validate_dag.py)"),
+    "bridges": ("validate_bridges", "bridges.csv against claims and loss composition (validate_bridges.py)"),
+    "loss-forms": ("validate_loss_forms", "LossForm/ReferenceLemma columns (validate_loss_forms.py)"),
+    "table": ("generate_table_from_csv", "LaTeX table from a proof-table CSV (generate_table_from_csv.py)"),
+    "plot": ("plot_anti_simulation", "Anti-simulation figures (plot_anti_simulation.py)"),
+    "budget": ("budget_grid", "Anti-simulation budget-ratio and threshold tables over (k, n, beta)"),
+}
+CHECK = ("assets", "claims", "project")
+CHAIN = "+"
+
+
+def usage() -> str:
+    width = max(map(len, COMMANDS))
+    lines = [
+        "usage: python -m psitm <command> [options] [+ <command> [options] ...]",
+        "",
+        "commands:",
+        f"  {'check':<{width}}  {' + '.join(CHECK)} in one process ([--no-cache] [--jobs N])",
+    ]
+    lines += [f"  {name:<{width}}  {text}" for name, (_, text) in COMMANDS.items()]
+    lines += ["", "`python -m psitm <command> --help` shows the options of one command."]
+    return "\n".join(lines)
+
+
+def run(name: str, argv: list[str]) -> int:
+    """Import the module behind one command and run its main(argv)."""
+    module = importlib.import_module(f"psitm.commands.{COMMANDS[name][0]}")
+    rc = module.main(argv)
+    sys.stdout.flush()
+    return rc or 0
+
+
+def check_chain(argv: list[str]) -> list[tuple[str, list[str]]]:
+    """The `check` arguments forwarded to assets, claims and project."""
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="psitm check", description=f"Run {' + '.join(CHECK)} in one process")
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update .cache/psitm-check/")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes for .tex/.lean extraction")
+    args = ap.parse_args(argv)
+    cache = ["--no-cache"] if args.no_cache else []
+    jobs = ["--jobs", str(args.jobs)]
+    return [("assets", cache + jobs), ("claims", cache), ("project", cache + jobs)]
+
+
+def split_chain(argv: list[str]) -> list[list[str]]:
+    parts: list[list[str]] = [[]]
+    for arg in argv:
+        if arg == CHAIN:
+            parts.append([])
+        else:
+            parts[-1].append(arg)
+    return [p for p in parts if p]
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+    steps: list[tuple[str, list[str]]] = []
+    for name, *rest in split_chain(argv):
+        if name == "check":
+            steps += check_chain(rest)
+        elif name in COMMANDS:
+            steps.append((name, rest))
+        else:
+            print(f"[ERR] unknown command: {name}\n\n{usage()}", file=sys.stderr)
+            return 2
+    return max(run(name, rest) for name, rest in steps)
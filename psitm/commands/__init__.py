@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Implementations of the `python -m psitm` subcommands; each module has main(argv) -> int."""
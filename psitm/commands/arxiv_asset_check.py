@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+arxiv_asset_check — scan a LaTeX project and find unused/missing figures.
+
+Usage:
+  python -m psitm assets --root /path/to/project --ext png,pdf,jpg,jpeg,eps
+  python arxiv_asset_check.py ...   (same options)
+
+What it does:
+  - Recursively scans .tex files for \includegraphics[...]{...} and \graphicspath{ {dir/}{dir2/} }
+  - Resolves figure paths relative to each .tex file, project root, and graphicspath dirs
+  - Lists:
+      * REFERENCED BUT MISSING (used in TeX, file not found)
+      * PRESENT BUT UNUSED (on disk, but not referenced anywhere)
+  - Writes 'delete_unused_figs.sh' and 'delete_unused_figs.ps1' to remove UNUSED images
+
+Notes:
+  - If an \includegraphics omits extension, we try all provided extensions (default png,pdf,jpg,jpeg,eps)
+  - Ignores build folders: .git, (v)env, _build, build, out, dist, __pycache__
+  - Per-file extraction is cached under this repo's .cache/psitm-check/
+    (trees/<hash of --root>/ for other trees), never inside --root;
+    --no-cache disables it
+  - --jobs N parses changed .tex files in N processes (report order does not change)
+  - Each directory is listed once and (dir, ref) resolutions are memoized, so
+    candidate paths cost no stat() call each (matters on network filesystems)
+"""
+
+import argparse, sys, os
+from pathlib import Path
+
+from ..check.cache import tree_cache_dir
+from ..check.paths import DirCache
+from ..check.scan import extract_tex, scan_project, shared_index
+
+ROOT = Path(__file__).resolve().parents[2]
+
+DEFAULT_IMG_EXTS = [".png", ".pdf", ".jpg", ".jpeg", ".eps"]
+
+def find_tex_files(root: Path):
+    yield from scan_project(root).tex_files()
+
+def graphicspath_dirs(raw_dirs: list[str], base_dir: Path, fs: DirCache | None = None) -> list[Path]:
+    """Absolute Paths for raw \graphicspath entries, relative to base_dir."""
+    resolve = Path.resolve if fs is None else fs.resolve
+    dirs: list[Path] = []
+    for raw in raw_dirs:
+        # normalize trailing slash
+        p = Path(raw)
+        if not p.is_absolute():
+            p = resolve(base_dir / p)
+        dirs.append(p)
+    return dirs
+
+def parse_graphicspaths(tex_text: str, base_dir: Path) -> list[Path]:
+    """Return list of directories (absolute Paths) from \graphicspath outside comments, relative to base_dir."""
+    return graphicspath_dirs(extract_tex(tex_text)["graphicspaths"], base_dir)
+
+def candidate_paths(raw_ref: str, base_dir: Path, exts: list[str], gspath_dirs: list[Path],
+                    fs: DirCache | None = None) -> list[Path]:
+    """Produce candidate absolute paths for a single \includegraphics reference."""
+    resolve = Path.resolve if fs is None else fs.resolve
+    cwd = Path.cwd()
+    cands: list[Path] = []
+    ref = Path(raw_ref)
+    # if path contains ~ or user vars, leave as-is (unlikely in TeX)
+    if ref.suffix.lower() in exts:
+        paths = [ref] if ref.is_absolute() else [
+            resolve(base_dir / ref),
+            resolve(cwd / ref)
+        ]
+    else:
+        # try with each extension
+        paths = []
+        for ext in exts:
+            if ref.is_absolute():
+                paths.append(ref.with_suffix(ext))
+            else:
+                paths.append(resolve(base_dir / (str(ref) + ext)))
+                paths.append(resolve(cwd / (str(ref) + ext)))
+                # also try under graphicspath dirs
+                for d in gspath_dirs:
+                    paths.append(resolve(d / (str(ref) + ext)))
+    # remove duplicates preserving order
+    seen = set(); 
+    for p in paths:
+        if p not in seen:
+            cands.append(p); seen.add(p)
+    return cands
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="psitm assets", description="Unused and missing figures of a LaTeX project")
+    ap.add_argument("--root", type=str, default=".", help="LaTeX project root")
+    ap.add_argument("--ext", type=str, default="png,pdf,jpg,jpeg,eps",
+                    help="Comma-separated image extensions to consider")
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update .cache/psitm-check/")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes for .tex extraction")
+    args = ap.parse_args(argv)
+
+    root = Path(args.root).resolve()
+    if not root.exists():
+        print(f"[ERR] root path does not exist: {root}", file=sys.stderr); return 1
+    img_exts = ["." + e.strip().lower().lstrip(".") for e in args.ext.split(",") if e.strip()]
+    if not img_exts:
+        img_exts = DEFAULT_IMG_EXTS
+
+    # 1) scan .tex files, collect \includegraphics and \graphicspath
+    include_slots: list[tuple[Path,str,tuple[list[Path],Path | None]]] = []  # (tex_file, raw_ref, (candidate_paths, first existing))
+    referenced_files: set[Path] = set()
+    missing_refs: list[tuple[Path,str,list[Path]]] = []
+
+    all_gspath_dirs: dict[Path, list[Path]] = {}
+
+    fs = DirCache()  # one listing per directory instead of a stat per candidate
+    resolved: dict[tuple[Path, str, tuple[Path, ...]], tuple[list[Path], Path | None]] = {}
+    # one walk; only changed .tex files re-read. The cache lives in this repo, not in the checked tree
+    index = shared_index(root, cache=not args.no_cache, jobs=args.jobs, cache_dir=tree_cache_dir(root, ROOT))
+    for tex, rec in index.tex.items():
+        gspath_dirs = graphicspath_dirs(rec["graphicspaths"], tex.parent, fs)
+        all_gspath_dirs[tex] = gspath_dirs
+        for raw in rec["includes"]:
+            key = (tex.parent, raw, tuple(gspath_dirs))
+            if key not in resolved:
+                cands = candidate_paths(raw, tex.parent, img_exts, gspath_dirs, fs)
+                # the first existing candidate is the resolution (LaTeX search order)
+                resolved[key] = cands, next((c for c in cands if fs.exists(c)), None)
+            include_slots.append((tex, raw, resolved[key]))
+
+    # 2) collect present images under root
+    present: set[Path] = {fs.resolve(p) for p in index.images(img_exts)}
+
+    # 3) mark resolved and missing references
+    satisfied: set[Path] = set()
+    for tex, raw, (cands, found) in include_slots:
+        if found is not None:
+            satisfied.add(found)
+        else:
+            missing_refs.append((tex, raw, cands))
+
+    # 4) compute unused (present but not referenced)
+    unused = sorted([p for p in present if p not in satisfied], key=lambda p: str(p))
+
+    # 5) print report
+    print("="*72)
+    print("[SUMMARY]")
+    print(f"Project root: {root}")
+    print(f".tex files scanned: {len(index.tex)}")
+    print(f"Referenced figure slots: {len(include_slots)}")
+    print(f"Present images: {len(present)}")
+    print(f"Resolved references: {len(satisfied)}")
+    print(f"Referenced but MISSING: {len(missing_refs)}")
+    print(f"Present but UNUSED: {len(unused)}")
+    print("="*72)
+
+    if missing_refs:
+        print("\n[REFERENCED BUT MISSING]")
+        for tex, raw, cands in missing_refs:
+            print(f"- {tex.relative_to(root)} : {{ {raw} }}")
+            for c in cands:
+                try:
+                    print(f"    tried: {c.relative_to(root)}")
+                except ValueError:
+                    print(f"    tried: {c}")
+
+    if unused:
+        print("\n[PRESENT BUT UNUSED]")
+        for p in unused:
+            try:
+                print(str(p.relative_to(root)))
+            except ValueError:
+                print(str(p))
+
+    # 6) write deletion scripts (UNUSED)
+    if unused:
+        sh = root / "delete_unused_figs.sh"
+        ps1 = root / "delete_unused_figs.ps1"
+        def rel(p: Path) -> str:
+            try:
+                return str(p.relative_to(root))
+            except ValueError:
+                return str(p)
+
+        with sh.open("w", encoding="utf-8") as f:
+            f.write("#!/usr/bin/env bash\nset -euo pipefail\n")
+            for p in unused:
+                f.write(f"rm -f '{rel(p)}'\n")
+        os.chmod(sh, 0o755)
+
+        with ps1.open("w", encoding="utf-8") as f:
+            f.write("$ErrorActionPreference = 'Stop'\n")
+            for p in unused:
+                f.write(f"Remove-Item -LiteralPath '{rel(p)}' -Force\n")
+
+        print(f"\nWrote deletion scripts:\n- {sh}\n- {ps1}")
+    return 0
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Anti-simulation budget-ratio tables over a (k, n, beta) grid.
+
+Usage:
+  python -m psitm budget
+  python -m psitm budget --k 2:100 --log2-n 1:64 --beta 0:1:1001 --format npy
+  python -m psitm budget --k 2,3,4,5 --log2-n 19.93 --beta 0.05:1:40 --out /tmp/budget
+
+- Axes: "a,b,c" lists values; "lo:hi" is every integer from lo to hi;
+  "lo:hi:num" is num evenly spaced values (np.linspace). n is given as
+  log2 n, so n = 2^64 and beyond is fine
+- The whole tensor is one broadcast log-space evaluation
+  (psitm.antisim.budget); thresholds are closed-form per (k, n)
+- Writes anti_simulation_budget.<fmt> (k, log2_n, beta, log2_ratio,
+  violated) and anti_simulation_threshold.<fmt> (k, log2_n, beta_threshold)
+  to results/<DATE>/anti_simulation/ (or --out)
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def parse_axis(text: str, integer: bool = False) -> list[float]:
+    """Values of one axis spec (see the module docstring)."""
+    import numpy as np
+
+    parts = text.split(":")
+    if len(parts) == 1:
+        values = [float(v) for v in text.split(",") if v.strip()]
+    elif len(parts) == 2:
+        lo, hi = int(parts[0]), int(parts[1])
+        values = [float(v) for v in range(lo, hi + 1)]
+    elif len(parts) == 3:
+        values = np.linspace(float(parts[0]), float(parts[1]), int(parts[2])).tolist()
+    else:
+        raise ValueError(f"bad axis: {text!r}")
+    if not values:
+        raise ValueError(f"empty axis: {text!r}")
+    if integer and any(v != int(v) for v in values):
+        raise ValueError(f"axis must be integer: {text!r}")
+    return values
+
+
+def main(argv: list[str] | None = None) -> int:
+    from ..sim.columnar import FORMATS, table_path
+
+    ap = argparse.ArgumentParser(prog="psitm budget", description="Anti-simulation budget-ratio tables")
+    ap.add_argument("--k", default="2:100", help="Depths k >= 2")
+    ap.add_argument("--log2-n", default="1:64", help="log2 n values (> 0)")
+    ap.add_argument("--beta", default="0:1:101", help="Exponents beta of s = n^beta")
+    ap.add_argument("--out", default=None, help="Output dir (default results/<DATE>/anti_simulation)")
+    ap.add_argument("--format", default="csv", help=f"Comma-separated table formats: {','.join(FORMATS)}")
+    args = ap.parse_args(argv)
+
+    formats = [f.strip() for f in args.format.split(",") if f.strip()]
+    bad = [f for f in formats if f not in FORMATS]
+    if bad or not formats:
+        print(f"[ERR] Unknown format(s): {bad or args.format}; choose from {', '.join(FORMATS)}")
+        return 1
+    try:
+        ks = parse_axis(args.k, integer=True)
+        log2_ns = parse_axis(args.log2_n)
+        betas = parse_axis(args.beta)
+    except ValueError as e:
+        print(f"[ERR] {e}")
+        return 1
+    out_dir = Path(args.out) if args.out else ROOT / "results" / date.today().isoformat() / "anti_simulation"
+
+    from ..antisim.budget import TABLE_NAME, THRESHOLD_NAME, write_budget
+
+    t0 = time.perf_counter()
+    try:
+        grid, _ = write_budget(out_dir, ks, log2_ns, betas, formats)
+    except ValueError as e:
+        print(f"[ERR] {e}")
+        return 1
+    ms = (time.perf_counter() - t0) * 1000.0
+    print(f"[OK] {len(ks)} k x {len(log2_ns)} n x {len(betas)} beta = {len(grid)} cells, "
+          f"{int(grid['violated'].sum())} violated ({ms:.0f} ms incl. writing)")
+    for fmt in formats:
+        print(f"[OK] Wrote {table_path(out_dir / TABLE_NAME, fmt)}")
+        print(f"[OK] Wrote {table_path(out_dir / THRESHOLD_NAME, fmt)}")
+    return 0
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Project checks (hardened), `python -m psitm project` / scripts/check_project.py:
+- Validate paper/claims.yaml via PyYAML; required file
+- Strict Lean ID detection using `-- ID: <Token>` headers
+- Verify deterministic seeds (1337) in notebooks
+- Detect missing LaTeX references: \ref{...} without a matching \label{...}
+- Validate figure paths: \includegraphics must resolve to existing files, prefer fig/
+- Bidirectional claims coverage for theorem labels (Budget:, Psi:, Lk:, AntiSim:)
+- Per-file extraction and parsed claims are cached in .cache/psitm-check/ (only changed files are re-parsed);
+  --no-cache re-reads everything; --jobs N parses changed files in N processes
+- --watch keeps the index in memory and prints new/fixed findings after each save
+  of a .tex/.lean file or claims.yaml and after a figure file is added or removed
+  (watchdog events when installed, otherwise polling every --interval seconds),
+  with the time since the save and the refresh + check time
+"""
+import argparse, importlib.util, re, time
+from pathlib import Path
+
+from ..check.claims import load_claims
+from ..check.scan import ProjectIndex, shared_index
+
+ROOT = Path(__file__).resolve().parents[2]
+
+CLAIMS = ROOT / "paper" / "claims.yaml"
+
+
+def list_tex_files(index: ProjectIndex) -> list[Path]:
+    return index.tex_files()
+
+
+def parse_claims_yaml(p: Path, cache: bool = True):
+    if not p.exists():
+        print(f"[ERR] Missing required claims file: {p}")
+        raise FileNotFoundError(str(p))
+    data = load_claims(p, cache_root=ROOT if cache else None).data
+    if not isinstance(data, list):
+        raise ValueError("claims.yaml must be a list of mappings")
+    entries = []
+    for entry in data:
+        if not isinstance(entry, dict):
+            raise ValueError("claims.yaml entries must be mappings")
+        latex = str(entry.get("latex", "")).strip()
+        lean  = str(entry.get("lean", "")).strip()
+        if not latex or not lean:
+            raise ValueError(f"claims.yaml entry missing latex/lean: {entry}")
+        entries.append({"latex": latex, "lean": lean})
+    return entries
+
+
+def collect_labels_refs_and_graphics(index: ProjectIndex):
+    return index.labels(), index.refs(), index.graphics()
+
+
+def collect_lean_ids(index: ProjectIndex) -> set[str]:
+    return index.lean_ids(recursive=False)
+
+
+def resolve_graphics_path(raw: str, base_dir: Path) -> Path:
+    p = Path(raw)
+    if p.is_absolute():
+        return p
+    # Prefer fig/ path at project root
+    if not p.parts or p.parts[0] != 'fig':
+        alt = ROOT / 'fig' / p.name
+        return alt
+    return (ROOT / p).resolve()
+
+
+MISSING_REFS = "[ERR] Missing LaTeX labels for refs:"
+GRAPHICS_EXTS = (".png", ".pdf", ".jpg", ".jpeg", ".eps")  # figure files --watch re-checks on add/remove
+
+
+def check_index(index: ProjectIndex, claims) -> list[tuple[str, str]]:
+    """Findings as (section header, item line) pairs in report order."""
+    findings: list[tuple[str, str]] = []
+    claim_labels = {e["latex"] for e in claims}
+    claim_ids    = {e["lean"] for e in claims}
+
+    labels, refs, graphics = collect_labels_refs_and_graphics(index)
+
+    # Missing refs
+    missing_refs = [r for r in refs if r not in labels]
+    for r in sorted(missing_refs):
+        findings.append((MISSING_REFS, f" - {r}"))
+
+    # Bidirectional claims coverage for theorem-like namespaces
+    ns_re = re.compile(r"^(Budget|Psi|Lk|AntiSim)[^:]*:.*$")
+    needed = {L for L in labels if ns_re.match(L)}
+    for L in sorted(needed - claim_labels):
+        findings.append(("[ERR] Theorem labels missing in claims.yaml:", f" - {L}"))
+
+    # Lean IDs declared via -- ID: headers
+    declared_ids = collect_lean_ids(index)
+    for i in sorted([i for i in claim_ids if i not in declared_ids]):
+        findings.append(("[ERR] Lean IDs declared in claims.yaml not found in lean/*.lean -- ID: headers:", f" - {i}"))
+
+    # Graphics existence (prefer fig/)
+    missing_graphics = []
+    wrong_dir = []
+    for tex, raw in graphics:
+        resolved = resolve_graphics_path(raw, tex.parent)
+        if not resolved.exists():
+            missing_graphics.append((tex, raw, resolved))
+        if 'paper/fig/' in raw:
+            wrong_dir.append((tex, raw))
+    for tex, raw in wrong_dir:
+        findings.append(("[ERR] Non-compliant figure paths (should use fig/):",
+                         f" - {tex.relative_to(ROOT)} : {{ {raw} }}"))
+    for tex, raw, res in missing_graphics:
+        try:
+            tex_rel = tex.relative_to(ROOT)
+        except ValueError:
+            tex_rel = tex
+        findings.append(("[ERR] Referenced figures not found:", f" - {tex_rel} : {{ {raw} }} -> {res}"))
+    return findings
+
+
+def report(findings: list[tuple[str, str]]) -> list[str]:
+    """Report lines: one header per section followed by its items."""
+    lines = [] if any(h == MISSING_REFS for h, _ in findings) else ["[OK] All refs have matching labels"]
+    header = None
+    for h, item in findings:
+        if h != header:
+            lines.append(h)
+            header = h
+        lines.append(item)
+    if not findings:
+        lines.append("[OK] Project checks passed")
+    return lines
+
+
+def _short(header: str, item: str) -> str:
+    return f"{header.removeprefix('[ERR] ').rstrip(':')}: {item.removeprefix(' - ')}"
+
+
+def since_save(paths: list[Path]) -> float | None:
+    """Milliseconds since the newest mtime among paths (None if none of them exists)."""
+    mtimes = []
+    for p in paths:
+        try:
+            mtimes.append(p.stat().st_mtime_ns)
+        except OSError:  # deleted
+            pass
+    return (time.time_ns() - max(mtimes)) / 1e6 if mtimes else None
+
+
+def watch(index: ProjectIndex, interval: float) -> int:
+    """Re-check on every change and print only new and resolved findings."""
+    from ..check.watch import watch_changes
+
+    cache = index.cache is not None
+    claims = parse_claims_yaml(CLAIMS, cache)
+    findings = check_index(index, claims)
+    print("\n".join(report(findings)))
+    print(f"[WATCH] Watching {ROOT} (Ctrl-C to stop)", flush=True)
+    try:
+        for t0, changed in watch_changes(index, extra=[CLAIMS], interval=interval, assets=GRAPHICS_EXTS):
+            if CLAIMS in changed:
+                try:
+                    claims = parse_claims_yaml(CLAIMS, cache)
+                except Exception as e:
+                    print("[ERR] claims.yaml parsing:", e, flush=True)
+                    continue
+            now = check_index(index, claims)
+            ms = (time.perf_counter() - t0) * 1000.0
+            names = ", ".join(sorted(str(p.relative_to(ROOT)) for p in changed))
+            saved = since_save(changed)
+            after_save = "" if saved is None else f"{saved:.1f} ms after save, "
+            print(f"[WATCH] {names} ({after_save}refresh + check {ms:.1f} ms)")
+            before, after = set(findings), set(now)
+            for h, item in now:
+                if (h, item) not in before:
+                    print(f"[NEW] {_short(h, item)}")
+            for h, item in findings:
+                if (h, item) not in after:
+                    print(f"[FIXED] {_short(h, item)}")
+            print("[OK] Project checks passed" if not now else f"[ERR] {len(now)} finding(s)", flush=True)
+            findings = now
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="psitm project", description="Project checks")
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update .cache/psitm-check/")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes for .tex/.lean extraction")
+    ap.add_argument("--watch", action="store_true", help="Keep running and re-check changed files")
+    ap.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds for --watch")
+    args = ap.parse_args(argv)
+    if importlib.util.find_spec("yaml") is None:  # imported only if claims.yaml must be parsed
+        print("[ERR] PyYAML not installed: No module named 'yaml'")
+        return 2
+
+    # Parse claims (required)
+    try:
+        claims = parse_claims_yaml(CLAIMS, cache=not args.no_cache)
+    except Exception as e:
+        print("[ERR] claims.yaml parsing:", e)
+        return 1
+
+    # Collect LaTeX labels, refs, graphics (one walk; files read once)
+    index = shared_index(ROOT, cache=not args.no_cache, jobs=args.jobs)
+    if args.watch:
+        return watch(index, args.interval)
+
+    findings = check_index(index, claims)
+    print("\n".join(report(findings)))
+    return 1 if findings else 0
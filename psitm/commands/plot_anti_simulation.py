@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Anti-simulation figures (budget ratio, failure modes, threshold beta) into fig/.
+Run as `python -m psitm plot` or scripts/plot_anti_simulation.py.
+
+- numpy and matplotlib are imported when a plot is drawn, not with the
+  module, so `python -m psitm` does not pay for them on the check commands
+- Ratios and thresholds come from psitm.antisim.budget (one broadcast
+  log-space evaluation per figure, closed-form threshold beta)
+- FIGURES holds each figure's data parameters and helper modules;
+  psitm.figures fingerprints them with the render code, the helpers'
+  source, RC_PARAMS and dpi, skips figures whose PNG
+  already carries that fingerprint and renders the rest with Agg in
+  --jobs worker processes (--force re-renders everything)
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from ..figures import FigureSpec, build
+
+OUT_DIR = "fig"
+DPI = 300
+
+RC_PARAMS = {
+    "mathtext.fontset": "stix",
+    "font.size": 12,
+    "axes.labelsize": 12,
+    "axes.titlesize": 14,
+    "legend.fontsize": 10,
+}
+
+
+def plot_budget(plt, n: int, ks: list[int], betas: tuple[float, float, int], figsize: tuple[float, float]):
+    import numpy as np
+
+    from ..antisim.budget import ratio_grid, threshold_beta
+
+    betas = np.linspace(*betas)
+    log2_n = np.log2(n)
+    ratios = 2.0 ** ratio_grid(ks, [log2_n], betas)[:, 0]  # logs cancel; linear on log-Y
+
+    fig, ax = plt.subplots(figsize=figsize)
+    for k, ratio in zip(ks, ratios):
+        ax.plot(betas, ratio, label=f"k={k}")
+
+    ax.axhline(1.0, color="k", linestyle="--", linewidth=1, label="violation threshold")
+
+    for k, b in zip(ks, threshold_beta(ks, log2_n)):
+        ax.axvline(b, linestyle=":", linewidth=1)
+        ax.text(
+            b, 1.2,
+            fr"$\beta_{{k={k}}}\approx{b:.3f}$",
+            rotation=90, va="bottom", ha="right",
+        )
+
+    ax.set_yscale("log")
+    ax.set_xlabel(r"$\beta$")
+    ax.set_ylabel(r"$\frac{s\,B(k-1,n)}{B(k,n)}$")
+    ax.set_title(r"Budget violation ratio vs $\beta$")
+    ax.legend(loc="best")
+    fig.tight_layout()
+    return fig
+
+
+def plot_modes(plt, modes: list[str], status: list[int], figsize: tuple[float, float]):
+    fig, ax = plt.subplots(figsize=figsize)
+    bars = ax.bar(modes, status)
+    for i, s in enumerate(status):
+        ax.text(i, s + 0.02, "Blocked" if s else "Allowed", ha="center", va="bottom")
+    ax.set_ylim(0, 1.15)
+    ax.set_ylabel("Bypass status")
+    ax.set_title("Failure mode analysis: all bypass routes blocked")
+    plt.setp(ax.get_xticklabels(), rotation=15, ha="right")
+    fig.tight_layout()
+    return fig
+
+
+def plot_budget_saved(plt, n: int, ks: list[int], betas: tuple[float, float, int], figsize: tuple[float, float]):
+    import numpy as np
+
+    from ..antisim.budget import ratio_grid
+
+    betas2 = np.linspace(*betas)
+    ratios = 2.0 ** ratio_grid(ks, [np.log2(n)], betas2)[:, 0]
+    fig, ax = plt.subplots(figsize=figsize)
+    for k, ratio in zip(ks, ratios):
+        ax.plot(betas2, ratio, label=f"k={k}")
+    ax.axhline(1.0, color="k", linestyle="--", linewidth=1)
+    ax.set_yscale("log")
+    ax.set_xlabel(r"$\beta$")
+    ax.set_ylabel(r"$\frac{s\,B(k-1,n)}{B(k,n)}$")
+    ax.set_title(r"Budget violation ratio vs $\beta$ (saved)")
+    ax.legend(loc="best")
+    fig.tight_layout()
+    return fig
+
+
+def plot_threshold(plt, ks: tuple[int, int], log2_ns: list[float], figsize: tuple[float, float]):
+    import numpy as np
+
+    from ..antisim.budget import threshold_beta
+
+    k = np.arange(ks[0], ks[1] + 1)
+    thr = threshold_beta(k[:, None], np.asarray(log2_ns, dtype=float)[None, :])
+    fig, ax = plt.subplots(figsize=figsize)
+    for j, log2_n in enumerate(log2_ns):
+        ax.plot(k, thr[:, j], label=fr"$n=2^{{{log2_n:g}}}$")
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel(r"$k$")
+    ax.set_ylabel(r"$\beta^*=\log(k/(k-1))/\log n$")
+    ax.set_title(r"Violation threshold $\beta^*$ vs $k$")
+    ax.legend(loc="best")
+    fig.tight_layout()
+    return fig
+
+
+BUDGET_DEPS = ("psitm.antisim.budget",)  # helpers the budget figures call
+
+FIGURES = {
+    "budget": FigureSpec("anti_simulation_budget.png", plot_budget, {
+        "n": 10 ** 6, "ks": [2, 3, 4, 5], "betas": (0.05, 1.0, 40), "figsize": (7.2, 4.2),
+    }, BUDGET_DEPS),
+    "modes": FigureSpec("anti_simulation_failure_modes.png", plot_modes, {
+        "modes": ["Super-log budget", "Randomized sim", "Advice", "Multi-pass"],
+        "status": [1, 1, 1, 1],  # 1=blocked
+        "figsize": (7.2, 3.2),
+    }),
+    "saved": FigureSpec("anti_simulation_budget_saved.png", plot_budget_saved, {
+        "n": 10 ** 6, "ks": [2, 3, 4, 5], "betas": (0.05, 1.0, 60), "figsize": (7.2, 4.2),
+    }, BUDGET_DEPS),
+    "threshold": FigureSpec("anti_simulation_threshold.png", plot_threshold, {
+        "ks": (2, 100), "log2_ns": [10, 20, 32, 64], "figsize": (7.2, 4.2),
+    }, BUDGET_DEPS),
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="psitm plot", description="Generate anti-simulation figures")
+    parser.add_argument(
+        "--plot",
+        nargs="+",
+        choices=[*FIGURES, "all"],
+        default=["all"],
+        help="Which plot(s) to generate",
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for figures that need rendering (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-render figures whose fingerprint matches")
+    args = parser.parse_args(argv)
+
+    names = list(FIGURES) if "all" in args.plot else list(dict.fromkeys(args.plot))
+    built = build([FIGURES[name] for name in names], OUT_DIR, RC_PARAMS, DPI, args.jobs, args.force)
+
+    # Basic existence checks for requested plots
+    for path, rendered in built:
+        if not (path.exists() and path.stat().st_size > 0):
+            print(f"error: missing or empty file: {path}", file=sys.stderr)
+            return 1
+        print("saved:" if rendered else "up to date:", path)
+    return 0
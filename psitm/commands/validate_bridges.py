@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Validate bridges CSV against claims and explicit-loss/composition rules.
+
+Checks:
+  1) CSV rows ↔ paper/claims.yaml IDs 1:1 for the three bridge IDs.
+  2) LossForm contains only allowed tokens: powers and log2 of named params.
+  3) Composition: Loss(M<->C) equals product of Loss(M<->T) and Loss(T<->C).
+
+Run as `python -m psitm bridges` or scripts/validate_bridges.py.
+"""
+import argparse
+import csv
+import re
+from pathlib import Path
+
+from ..check.claims import load_claims as load_claims_index
+from ..proof.dag import ProofDag
+from ..proof.loss import BASES, parse_loss, propagate
+
+ROOT = Path(__file__).resolve().parents[2]
+
+ALLOWED_IDS = {
+    "Bridge:MachineTree",
+    "Bridge:TreeCircuit",
+    "Bridge:MachineCircuit:Cor",
+}
+
+# Bridge rows as proof-DAG edges; the corollary edge comes last so it is the one checked
+BRIDGE_EDGES = {
+    "Bridge:MachineTree": ("Machine", "Tree"),
+    "Bridge:TreeCircuit": ("Tree", "Circuit"),
+    "Bridge:MachineCircuit:Cor": ("Machine", "Circuit"),
+}
+
+# Accept either unicode arrow or ASCII <-> in Bridge column
+NORM_BRIDGE_NAME = {
+    "Machine↔Tree": "Machine<->Tree",
+    "Tree↔Circuit": "Tree<->Circuit",
+    "Machine↔Circuit:Cor": "Machine<->Circuit:Cor",
+}
+
+# Allow composed log exponent as a+b
+LOSS_RE = re.compile(
+    r"^\(d\^[a-z]+\)\*\(log2\(n\)\^[a-z]+\)$"
+    r"|^\(k\^[a-z]+\)\*\(log2\(n\)\^[a-z]+\)$"
+    r"|^\(d\^[a-z]+\)\*\(k\^[a-z]+\)\*\(log2\(n\)\^[a-z]+(\+[a-z]+)?\)$"
+)
+
+def load_claims(claims_path: Path, cache: bool = True) -> set[str]:
+    return load_claims_index(claims_path, cache_root=ROOT if cache else None).lean_ids
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="psitm bridges", description="Validate bridges.csv")
+    ap.add_argument("--csv", required=True)
+    ap.add_argument("--claims", required=True)
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update .cache/psitm-check/")
+    args = ap.parse_args(argv)
+
+    csv_path = Path(args.csv)
+    claims_path = Path(args.claims)
+
+    if not csv_path.exists():
+        print(f"[ERR] Missing CSV: {csv_path}")
+        return 1
+    if not claims_path.exists():
+        print(f"[ERR] Missing claims: {claims_path}")
+        return 1
+
+    claims_ids = load_claims(claims_path, cache=not args.no_cache)
+    missing_ids = [i for i in ALLOWED_IDS if i not in claims_ids]
+    if missing_ids:
+        print("[ERR] Claims missing bridge IDs:")
+        for i in missing_ids:
+            print(" -", i)
+        return 1
+
+    rows = list(csv.DictReader(csv_path.read_text(encoding="utf-8").splitlines()))
+    if len(rows) != 3:
+        print(f"[ERR] CSV must have exactly 3 rows, found {len(rows)}")
+        return 1
+
+    # Map by ReferenceLemma
+    by_ref = {r["ReferenceLemma"]: r for r in rows}
+    for rid in ALLOWED_IDS:
+        if rid not in by_ref:
+            print(f"[ERR] Missing row for {rid}")
+            return 1
+
+    # Explicit loss check
+    for r in rows:
+        lf = r.get("LossForm", "").strip()
+        # Allow $...$ math wrappers from LaTeX table rendering
+        if lf.startswith("$") and lf.endswith("$"):
+            lf = lf[1:-1]
+        if not lf:
+            print(f"[ERR] Empty LossForm in row {r}")
+            return 1
+        if not LOSS_RE.fullmatch(lf):
+            print(f"[ERR] LossForm not explicit or not allowed: {lf}")
+            return 1
+
+    # Composition check: Loss(M<->C) must equal the loss composed along M->T->C
+    dag = ProofDag()
+    losses = {}
+    for rid, edge in BRIDGE_EDGES.items():
+        dag.add_edge(*edge)
+        losses[edge] = parse_loss(by_ref[rid]["LossForm"])
+    _, mismatches = propagate(dag, losses)
+
+    ok = True
+    for m in mismatches:
+        for base in BASES:
+            got, exp = m.declared.exponent(base), m.composed.exponent(base)
+            if got != exp:
+                print(f"[ERR] {base} exponent mismatch: expected {exp}, got {got}")
+                ok = False
+
+    if not ok:
+        return 1
+
+    print("[OK] bridges.csv validated against claims and composition")
+    return 0
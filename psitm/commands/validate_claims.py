@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Validate paper/claims.yaml (or the claims file given as the first argument)
+structure and uniqueness, and ensure referenced Lean IDs are declared with
+strict header lines in lean/*.lean files:
+  -- ID: <Token>
+Lean extraction and the parsed claims are cached in .cache/psitm-check/ unless
+--no-cache is given. --dag/--bridges/--relax also report IDs those tables use
+that no claim declares. Run as `python -m psitm claims` or scripts/validate_claims.py.
+"""
+import argparse
+import csv
+from pathlib import Path
+
+from ..check.claims import load_claims
+from ..check.scan import shared_index
+
+ROOT = Path(__file__).resolve().parents[2]
+CLAIMS = ROOT / "paper/claims.yaml"
+
+GAP_HEADERS = {
+    "dag": "[ERR] Proof-DAG nodes not declared in claims.yaml:",
+    "bridges": "[ERR] Bridge ReferenceLemmas not declared in claims.yaml:",
+    "relax": "[ERR] Relaxation ReferenceLemmas not declared in claims.yaml:",
+}
+
+def collect_declared_ids(cache: bool = True) -> set[str]:
+    return shared_index(ROOT, cache=cache).lean_ids()
+
+def read_column(path: str, *columns: str) -> list[str]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return [row[c] for row in csv.DictReader(f) for c in columns if row.get(c)]
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="psitm claims", description="Validate paper/claims.yaml")
+    ap.add_argument("claims", nargs="?", default=str(CLAIMS), help="claims.yaml to validate (default: paper/claims.yaml)")
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update .cache/psitm-check/")
+    ap.add_argument("--dag", help="proof_dag.csv whose From/To nodes must be claimed")
+    ap.add_argument("--bridges", help="bridges.csv whose ReferenceLemmas must be claimed")
+    ap.add_argument("--relax", help="relaxations.csv whose ReferenceLemmas must be claimed")
+    args = ap.parse_args(argv)
+    path = Path(args.claims)
+    if not path.exists():
+        print(f"[ERR] Missing claims file: {path}")
+        return 1
+    claims = load_claims(path, cache_root=None if args.no_cache else ROOT)
+    if not isinstance(claims.data, list):
+        print("[ERR] claims.yaml must be a list of mappings")
+        return 1
+    ok = not claims.problems
+    for problem in claims.problems:
+        print(f"[ERR] {problem}")
+    gaps = claims.join(
+        lean_headers=collect_declared_ids(cache=not args.no_cache),
+        dag_nodes=read_column(args.dag, "From", "To") if args.dag else None,
+        bridge_refs=read_column(args.bridges, "ReferenceLemma") if args.bridges else None,
+        relax_ids=read_column(args.relax, "ReferenceLemma") if args.relax else None,
+    )
+    if gaps["lean"]:
+        ok = False
+        print("[ERR] Lean IDs not declared with strict '-- ID:' header:")
+        for i in gaps["lean"]:
+            print(" -", i)
+    for key, header in GAP_HEADERS.items():
+        if gaps.get(key):
+            ok = False
+            print(header)
+            for i in gaps[key]:
+                print(" -", i)
+    if ok:
+        print("[OK] claims.yaml is valid and Lean IDs are declared")
+        return 0
+    return 1
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Validate proof_dag.csv (headers, loss grammar, claimed IDs, acyclicity, loss
+composition) and Graphviz dependency graphs for cycles.
+Run as `python -m psitm dag` or scripts/validate_dag.py.
+"""
+import argparse, csv, importlib.util, re
+from pathlib import Path
+
+from ..proof.dag import ProofDag, load_dot
+from ..proof.loss import Loss, parse_loss, propagate
+
+ROOT = Path(__file__).resolve().parents[2]
+CLAIMS = ROOT / 'paper' / 'claims.yaml'
+
+LOSS = re.compile(
+    r'^\s*\(log_2\s*M\)\^\s*(?P<a>-?\d+|α|β)\s*×\s*\(B\(\s*d\s*,\s*n\s*\)\)\^\s*(?P<b>-?\d+|α|β)\s*\s*$'
+)
+ID = re.compile(r'^[A-Z][A-Za-z0-9]*(?:\.[A-Za-z0-9_]+)+$')
+HEADERS = {"From","To","LossForm","Parameters","ReferenceLemma","Notes"}
+
+def load_known_ids(claims_path: str, cache: bool = True) -> set[str]:
+    claims_file = Path(claims_path)
+    if not claims_file.exists():
+        return set()
+    if importlib.util.find_spec("yaml") is None:
+        return set()
+    from ..check.claims import load_claims
+    return load_claims(claims_file, cache_root=ROOT if cache else None).lean_ids
+
+from typing import Set, Dict, Tuple
+
+def check_csv(path: Path, known: Set[str], strict: bool) -> int:
+    rc = 0
+    with path.open(newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        if set(reader.fieldnames or []) != HEADERS:
+            print(f"[FAIL] {path}: headers must be exactly {sorted(HEADERS)}, got {reader.fieldnames}")
+            return 1
+        # ID format checks + loss regex
+        dag = ProofDag()
+        losses: Dict[Tuple[str, str], Loss] = {}
+        rows: Dict[Tuple[str, str], int] = {}
+        ok = True
+        for i, row in enumerate(reader, 1):
+            frm = row['From'] or ''
+            to = row['To'] or ''
+            lf = row['LossForm'] or ''
+            rl = row['ReferenceLemma'] or ''
+            # exact loss grammar
+            if not LOSS.match(lf):
+                print(f"[FAIL] {path}:{i} LossForm regex mismatch: {lf}")
+                ok = False
+            else:
+                loss = parse_loss(lf)
+                if losses.setdefault((frm, to), loss) != loss:
+                    print(f"[FAIL] {path}:{i} LossForm conflicts with row {rows[frm, to]} for the same edge: {lf}")
+                    ok = False
+                rows.setdefault((frm, to), i)
+            # strict node existence in claims if requested
+            if strict:
+                if frm not in known:
+                    print(f"[FAIL] {path}:{i} From node not found in claims.yaml: {frm}")
+                    ok = False
+                if to not in known:
+                    print(f"[FAIL] {path}:{i} To node not found in claims.yaml: {to}")
+                    ok = False
+            # reference must exist in claims
+            if rl not in known:
+                print(f"[FAIL] {path}:{i} ReferenceLemma unknown: {rl}")
+                ok = False
+            dag.add_edge(frm, to)
+        if not ok:
+            rc |= 1
+        # DAG acyclicity: Kahn's algorithm, cycles reported as strongly connected components
+        if check_acyclic(path, dag):
+            rc |= 1
+        else:
+            # composed loss along every path: parallel paths must compose alike
+            _, mismatches = propagate(dag, losses)
+            for m in mismatches:
+                print(f"[FAIL] {path}:{rows[m.edge]} LossForm {m.declared} of {m.edge[0]} -> {m.edge[1]} "
+                      f"disagrees with the other path from {m.source}, which composes to {m.composed}")
+            rc |= 1 if mismatches else 0
+        if rc == 0:
+            print(f"[OK] {path}")
+        return rc
+
+def check_acyclic(path: Path, dag: ProofDag) -> int:
+    if dag.topological_order() is not None:
+        return 0
+    print(f"[FAIL] {path}: cycle(s) detected; not a DAG")
+    for members in dag.cycles():
+        print(f"[FAIL] {path}: cycle through {len(members)} node(s): {', '.join(members)}")
+    return 1
+
+def check_dot(path: Path) -> int:
+    rc = check_acyclic(path, load_dot(path))
+    if rc == 0:
+        print(f"[OK] {path}")
+    return rc
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="psitm dag", description="Validate the proof DAG")
+    ap.add_argument('--csv')
+    ap.add_argument('--dot', help='Graphviz dependency graph to check for cycles (e.g. docs/deps/psi_dag.gv)')
+    ap.add_argument('--claims', default=str(CLAIMS))
+    ap.add_argument('--strict', action='store_true')
+    ap.add_argument('--no-cache', action='store_true', help='Ignore and do not update .cache/psitm-check/')
+    args = ap.parse_args(argv)
+    if not args.csv and not args.dot:
+        ap.error('one of --csv or --dot is required')
+    rc = 0
+    if args.csv:
+        known = load_known_ids(args.claims, cache=not args.no_cache)
+        rc |= check_csv(Path(args.csv), known, args.strict)
+    if args.dot:
+        rc |= check_dot(Path(args.dot))
+    return rc
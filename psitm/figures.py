@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Fingerprinted, parallel figure builds for the plotting commands.
+
+- A FigureSpec names the PNG, the render function (render(plt, **params) ->
+  matplotlib Figure, defined at module level so workers can import it) and
+  the data parameters it draws from; deps lists the modules (dotted names)
+  whose helpers the render function calls
+- fingerprint hashes the render function's source, the source files of its
+  deps, its params, the rcParams style, dpi, the matplotlib version and
+  PIPELINE_VERSION, so editing a helper such as psitm.antisim.budget
+  re-renders the figures that list it; the hash is stored in the PNG
+  itself (tEXt chunk FINGERPRINT_KEY), so a figure is current
+  exactly when its file carries the fingerprint of the spec that would draw it
+- build skips current figures, reading only the PNG chunk headers (neither
+  matplotlib nor the image data is loaded for them), and renders the rest
+  with the Agg backend, in up to `jobs` worker processes; each file is
+  written to a temporary name and moved into place, so an interrupted build
+  never leaves a PNG that looks current
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+PIPELINE_VERSION = 1  # bump when build/savefig arguments change
+FINGERPRINT_KEY = "psitm-fingerprint"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class FigureSpec(NamedTuple):
+    filename: str
+    render: Callable
+    params: dict
+    deps: tuple[str, ...] = ()
+
+
+def _matplotlib_version() -> str | None:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("matplotlib")
+    except PackageNotFoundError:
+        return None
+
+
+def module_digest(name: str) -> str:
+    """SHA-256 of a module's source file, located without importing the module."""
+    found = importlib.util.find_spec(name)
+    if found is None or not found.origin:
+        raise ModuleNotFoundError(f"figure dependency not found: {name}")
+    return hashlib.sha256(Path(found.origin).read_bytes()).hexdigest()
+
+
+def fingerprint(spec: FigureSpec, style: dict, dpi: int) -> str:
+    payload = {
+        "pipeline": PIPELINE_VERSION,
+        "render": f"{spec.render.__module__}.{spec.render.__qualname__}",
+        "source": inspect.getsource(spec.render),
+        "deps": {name: module_digest(name) for name in spec.deps},
+        "params": spec.params,
+        "style": style,
+        "dpi": dpi,
+        "matplotlib": _matplotlib_version(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+
+
+def png_text(path: Path) -> dict[str, str]:
+    """tEXt chunks of a PNG as {keyword: text}; {} if the file is missing or not a PNG."""
+    out: dict[str, str] = {}
+    try:
+        with open(path, "rb") as f:
+            if f.read(8) != PNG_SIGNATURE:
+                return out
+            while True:
+                head = f.read(8)
+                if len(head) < 8:
+                    break
+                length, kind = struct.unpack(">I4s", head)
+                if kind == b"tEXt":
+                    key, _, value = f.read(length).partition(b"\0")
+                    out[key.decode("latin-1")] = value.decode("latin-1")
+                    f.seek(4, os.SEEK_CUR)  # CRC
+                elif kind == b"IEND":
+                    break
+                else:
+                    f.seek(length + 4, os.SEEK_CUR)
+    except OSError:
+        pass
+    return out
+
+
+def render(spec: FigureSpec, path: Path, digest: str, style: dict, dpi: int) -> Path:
+    """Draw spec with Agg and write it to path, tagged with digest."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    matplotlib.rcParams.update(style)
+    fig = spec.render(plt, **spec.params)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        fig.savefig(tmp, format="png", dpi=dpi, bbox_inches="tight", metadata={FINGERPRINT_KEY: digest})
+    finally:
+        plt.close(fig)
+    os.replace(tmp, path)
+    return path
+
+
+def build(specs: list[FigureSpec], out_dir: Path, style: dict, dpi: int = 300,
+          jobs: int = 1, force: bool = False) -> list[tuple[Path, bool]]:
+    """(path, rendered) per spec, in order; figures whose PNG has the current fingerprint are skipped."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    result, todo = [], []
+    for spec in specs:
+        path = out_dir / spec.filename
+        digest = fingerprint(spec, style, dpi)
+        stale = force or png_text(path).get(FINGERPRINT_KEY) != digest
+        result.append((path, stale))
+        if stale:
+            todo.append((spec, path, digest, style, dpi))
+    if jobs > 1 and len(todo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as ex:
+            for f in [ex.submit(render, *args) for args in todo]:
+                f.result()
+    else:
+        for args in todo:
+            render(*args)
+    return result
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Array helpers for the L_k pointer-chase and Lkphase experiments."""
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized pointer chasing for the L_k fooling-family experiments.
+
+- The k tables T_1..T_k : [m] -> [m] live in one contiguous (k, m) array;
+  row j is drawn exactly like the notebook's j-th rng.integers(0, m, size=m)
+  call, so the same Generator yields the same tables
+- chase resolves the chains of a batch of start points with k fancy-indexing
+  steps (u <- T_j[u] for the whole batch) instead of k Python lookups per point
+- distinct_outputs counts distinct chain endpoints over a start set S with an
+  O(m) occupancy mask rather than a sort
+- fooling_row measures log2 M for the fooling family directly: with
+  T_1..T_{k-1} fixed, every distinct endpoint of S under the prefix carries
+  one free answer bit of the varied last layer (T_k, b), so log2 M equals
+  the number of distinct prefix endpoints (the notebook proxy is alpha*m)
+- Tables use the narrowest unsigned dtype holding m-1 (table_dtype); for m
+  beyond RAM, seeded_tables fills an np.memmap file block by block, block b
+  of table j drawn from default_rng([seed, j, b]), so the contents depend
+  only on (m, k, seed) and never on how much is generated at once
+- seeded_fooling_row runs the fooling measurement on such tables with
+  S = [0, floor(alpha*m)), which is as good as a random S for independent
+  random tables and makes the first layer a sequential scan
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+BATCH = 1 << 20  # start points resolved per pass in chase
+BLOCK = 1 << 22  # table entries per seeded block in seeded_tables (part of the file format)
+UINT_DTYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+
+
+def ceil_log2(m: int) -> int:
+    return int(np.ceil(np.log2(max(2, m))))
+
+
+def table_dtype(m: int) -> np.dtype:
+    """Narrowest unsigned dtype holding every pointer in [0, m-1]."""
+    for dt in UINT_DTYPES:
+        if m - 1 <= np.iinfo(dt).max:
+            return np.dtype(dt)
+    raise ValueError(f"m too large: {m}")
+
+
+def generate_tables(m: int, k: int, rng: np.random.Generator, dtype=None) -> np.ndarray:
+    """(k, m) array (default dtype: table_dtype(m)); row j is T_{j+1} with entries in [0, m-1]."""
+    tables = np.empty((k, m), dtype=table_dtype(m) if dtype is None else dtype)
+    for j in range(k):
+        tables[j] = rng.integers(low=0, high=m, size=m, dtype=np.int64)
+    return tables
+
+
+def seeded_tables(m: int, k: int, seed: int, path: Path | None = None, block: int = BLOCK) -> np.ndarray:
+    """(k, m) tables drawn per block from default_rng([seed, j, b]); memory-mapped at path if given.
+
+    The .npy file carries dtype and shape; a <path>.json sidecar records m, k, seed, dtype and block.
+    """
+    dtype = table_dtype(m)
+    if path is None:
+        tables = np.empty((k, m), dtype=dtype)
+    else:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tables = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(k, m))
+    for j in range(k):
+        for b, lo in enumerate(range(0, m, block)):
+            hi = min(lo + block, m)
+            rng = np.random.default_rng([seed, j, b])
+            tables[j, lo:hi] = rng.integers(low=0, high=m, size=hi - lo, dtype=dtype)
+    if path is not None:
+        tables.flush()
+        meta = {"m": m, "k": k, "seed": seed, "dtype": dtype.name, "block": block}
+        path.with_name(path.name + ".json").write_text(json.dumps(meta), encoding="utf-8")
+    return tables
+
+
+def open_tables(path: Path) -> np.ndarray:
+    """Read-only memory map of tables written by seeded_tables."""
+    return np.load(Path(path), mmap_mode="r")
+
+
+def compose_pointer(tables: np.ndarray, s: int) -> int:
+    """Endpoint of a single start point (scalar reference for chase)."""
+    u = s
+    for T in tables:
+        u = int(T[u])
+    return u
+
+
+def chase(tables: np.ndarray, starts: np.ndarray | None = None, batch: int = BATCH) -> np.ndarray:
+    """Endpoints T_k(...T_1(s)) for every s in starts (default: all of [m])."""
+    m = tables.shape[1]
+    if starts is None:
+        starts = np.arange(m, dtype=tables.dtype)
+    starts = np.asarray(starts)
+    out = np.empty(starts.shape, dtype=tables.dtype)
+    for lo in range(0, len(starts), batch):
+        u = starts[lo:lo + batch]
+        for T in tables:
+            u = T[u]
+        out[lo:lo + batch] = u
+    return out
+
+
+def distinct_outputs(tables: np.ndarray, starts: np.ndarray | None = None, batch: int = BATCH) -> int:
+    """Number of distinct endpoints of the chains starting in starts."""
+    seen = np.zeros(tables.shape[1], dtype=bool)
+    if starts is None:
+        starts = np.arange(tables.shape[1], dtype=tables.dtype)
+    for lo in range(0, len(starts), batch):
+        seen[chase(tables, starts[lo:lo + batch], batch)] = True
+    return int(np.count_nonzero(seen))
+
+
+def fooling_row(m: int, k: int, rng: np.random.Generator, alpha: float = 0.9, c: float = 1.0) -> dict:
+    """One fooling-family measurement: fixed random T_1..T_{k-1}, |S| = floor(alpha*m)."""
+    prefix = generate_tables(m, k - 1, rng)
+    S_size = int(np.floor(alpha * m))
+    S = rng.choice(m, size=S_size, replace=False).astype(prefix.dtype)
+    return _fooling_stats(m, k, S_size, distinct_outputs(prefix, S), c)
+
+
+def seeded_fooling_row(m: int, k: int, seed: int, alpha: float = 0.9, c: float = 1.0,
+                       path: Path | None = None, batch: int = BATCH) -> dict:
+    """fooling_row on seeded_tables (memory-mapped at path if given) with S = [0, floor(alpha*m))."""
+    prefix = seeded_tables(m, k - 1, seed, path)
+    S_size = int(np.floor(alpha * m))
+    seen = np.zeros(m, dtype=bool)
+    for lo in range(0, S_size, batch):
+        seen[chase(prefix, np.arange(lo, min(lo + batch, S_size), dtype=prefix.dtype), batch)] = True
+    return _fooling_stats(m, k, S_size, int(np.count_nonzero(seen)), c)
+
+
+def _fooling_stats(m: int, k: int, S_size: int, log2_M_emp: int, c: float) -> dict:
+    alpha_emp = S_size / m
+    # Encoding size: n = k*m*ceil(log2 m) + m
+    n = k * m * ceil_log2(m) + m
+    log2_M_est = alpha_emp * m
+    # Lower bound: T >= log M / B(k-1,n) with B = c*(k-1)*log2(n)
+    denom = c * (k - 1) * np.log2(max(2, n))
+    return {
+        "m": m,
+        "n": n,
+        "alpha_emp": alpha_emp,
+        "log2_M_est": log2_M_est,
+        "log2_M_emp": log2_M_emp,
+        "T_lb_est": float(log2_M_est / denom),
+        "T_lb_emp": float(log2_M_emp / denom),
+    }
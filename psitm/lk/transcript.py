@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Batched transcript hashing for the Lkphase phase-lock experiments.
+
+- Snapshots S_1..S_k : [m] -> {0,1}^ell live in one (k, m, ell) int8 array,
+  drawn exactly like the notebook's k rng.integers(0, 2, size=(m, ell)) calls
+- pack_snapshots packs every row with np.packbits (little bit order) into one
+  uint64 word per (phase, position); ell = ceil(log2 m) <= 64, so a
+  transcript at depth d is just the d words of its position
+- S_k(q) variants are integers v whose bit r is row bit r (as in the notebook),
+  so a variant is substituted as a word without copying any snapshot
+- transcript_hashes hashes whole batches of positions x variants from these
+  contiguous words; HASHES picks the function:
+  - fast: vectorized splitmix64-style chain over the words (non-cryptographic)
+  - sha256: SHA-256 of the little-endian word bytes, truncated to its first
+    64 bits (big-endian), one hashlib call per transcript
+  Both return uint64 arrays, so distinct counts and sketches treat them alike
+- count_distinct counts distinct hashes with a sort instead of a set
+- class_census sweeps every position q and every S_k(q) variant and returns
+  the number of distinct transcript classes per q: exact (sorted rows, many
+  positions per batch) when 2^ell <= exact_limit, otherwise streamed in
+  batches through a per-q HyperLogLog sketch, so memory stays bounded;
+  class_distribution turns the per-q counts into {classes: positions}
+"""
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+
+from .sketch import HLL_P, HyperLogLog
+
+HASHES = ("fast", "sha256")
+EXACT_LIMIT = 1 << 22  # variants per q counted exactly; larger sweeps use HyperLogLog
+BATCH = 1 << 20  # transcripts hashed per step in class_census
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def generate_snapshots(m: int, k: int, rng: np.random.Generator) -> tuple[np.ndarray, int]:
+    """((k, m, ell) int8 bit array, ell) with ell = ceil(log2 m)."""
+    ell = int(np.ceil(np.log2(m)))
+    snapshots = np.empty((k, m, ell), dtype=np.int8)
+    for j in range(k):
+        snapshots[j] = rng.integers(0, 2, size=(m, ell), dtype=np.int8)
+    return snapshots, ell
+
+
+def pack_snapshots(snapshots: np.ndarray) -> np.ndarray:
+    """(k, m) uint64 words; bit r of word (j, q) is S_{j+1}(q)[r]."""
+    snapshots = np.asarray(snapshots)
+    if snapshots.shape[-1] > 64:
+        raise ValueError(f"rows wider than 64 bits: {snapshots.shape[-1]}")
+    packed = np.packbits(snapshots.astype(np.uint8), axis=-1, bitorder="little")
+    padded = np.zeros(snapshots.shape[:-1] + (8,), dtype=np.uint8)
+    padded[..., :packed.shape[-1]] = packed
+    return padded.view("<u8")[..., 0].astype(np.uint64)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    x = x ^ (x >> np.uint64(30))
+    x = x * _M1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _M2
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_words(words: np.ndarray, hash: str = "fast") -> np.ndarray:
+    """uint64 hash of each row of a (..., P) uint64 word array."""
+    words = np.asarray(words, dtype=np.uint64)
+    if hash == "fast":
+        with np.errstate(over="ignore"):  # uint64 products wrap mod 2**64 by design
+            h = np.full(words.shape[:-1], words.shape[-1], dtype=np.uint64)
+            for j in range(words.shape[-1]):
+                h = _mix64((h ^ words[..., j]) + _GOLDEN)
+        return h
+    if hash == "sha256":
+        flat = np.ascontiguousarray(words.reshape(-1, words.shape[-1]), dtype="<u8")
+        out = np.fromiter(
+            (int.from_bytes(hashlib.sha256(row.tobytes()).digest()[:8], "big") for row in flat),
+            dtype=np.uint64, count=len(flat),
+        )
+        return out.reshape(words.shape[:-1])
+    raise ValueError(f"unknown hash: {hash}")
+
+
+def count_distinct(hashes: np.ndarray) -> int:
+    """Number of distinct values (sort-based; much faster than np.unique on large uint64 arrays)."""
+    flat = np.sort(np.asarray(hashes).ravel())
+    if flat.size == 0:
+        return 0
+    return 1 + int(np.count_nonzero(flat[1:] != flat[:-1]))
+
+
+def transcript_hashes(words: np.ndarray, qs, depth: int, variants=None, hash: str = "fast") -> np.ndarray:
+    """Hashes of the depth-d transcripts (phases 1..d) at positions qs.
+
+    With variants, S_k(q) (the last phase) is replaced by each variant and the
+    result has shape (len(qs), len(variants)); phases beyond depth are not
+    hashed, so at depth k-1 every variant of a position hashes alike.
+    """
+    k = words.shape[0]
+    if not 1 <= depth <= k:
+        raise ValueError(f"depth must be in [1, {k}]: {depth}")
+    qs = np.asarray(qs, dtype=np.int64)
+    prefix = words[:depth, qs].T  # (Q, depth)
+    if variants is None:
+        return hash_words(prefix, hash)
+    variants = np.asarray(variants, dtype=np.uint64)
+    block = np.broadcast_to(prefix[:, None, :], (len(qs), len(variants), depth)).copy()
+    if depth == k:
+        block[:, :, k - 1] = variants[None, :]
+    return hash_words(block, hash)
+
+
+def class_census(words: np.ndarray, ell: int, depth: int, qs=None, hash: str = "fast",
+                 exact_limit: int = EXACT_LIMIT, batch: int = BATCH,
+                 p: int = HLL_P) -> tuple[np.ndarray, np.ndarray]:
+    """(distinct depth-d transcript classes per q over all 2^ell S_k(q) variants, exact mask)."""
+    m = words.shape[1]
+    qs = np.arange(m, dtype=np.int64) if qs is None else np.asarray(qs, dtype=np.int64)
+    V = 1 << ell
+    counts = np.empty(len(qs), dtype=np.int64)
+    if V <= exact_limit:
+        variants = np.arange(V, dtype=np.uint64)
+        per = max(1, batch // V)
+        for lo in range(0, len(qs), per):
+            h = np.sort(transcript_hashes(words, qs[lo:lo + per], depth, variants, hash), axis=1)
+            counts[lo:lo + per] = 1 + np.count_nonzero(h[:, 1:] != h[:, :-1], axis=1)
+        return counts, np.ones(len(qs), dtype=bool)
+    for i, q in enumerate(qs):
+        sketch = HyperLogLog(p)
+        for lo in range(0, V, batch):
+            variants = np.arange(lo, min(lo + batch, V), dtype=np.uint64)
+            sketch.add(transcript_hashes(words, [q], depth, variants, hash))
+        counts[i] = round(sketch.estimate())
+    return counts, np.zeros(len(qs), dtype=bool)
+
+
+def class_distribution(counts: np.ndarray) -> dict[int, int]:
+    """{number of transcript classes: number of positions q with that many}."""
+    values, freq = np.unique(np.asarray(counts), return_counts=True)
+    return {int(v): int(f) for v, f in zip(values, freq)}
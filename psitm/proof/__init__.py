@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Proof-DAG tables (proof_dag.csv, docs/deps/psi_dag.gv) as graphs."""
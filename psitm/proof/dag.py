@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Integer-indexed proof DAG: topological order, cycle reporting, incremental edges.
+
+- Nodes are lemma IDs mapped to 0..V-1 on first sight (ids / index); edges are
+  kept once each in successor and predecessor lists (A -> B as in the table)
+- topological_order: Kahn's algorithm on a deque, O(V+E); ties keep node
+  insertion order, so the order is reproducible. None if there is a cycle
+- cycles: Tarjan's strongly connected components (iterative, O(V+E)); every
+  component with more than one node, or a node with a self-loop, is a cycle
+  and is reported with its member IDs
+- add_edge keeps an already computed order valid incrementally
+  (Pearce-Kelly): only nodes between the two endpoints' positions are
+  visited and reordered, instead of re-sorting the whole graph. An edge that
+  closes a cycle is still added; add_edge returns that cycle and the order
+  is recomputed (and found invalid) on the next request
+- load_csv reads From/To of proof_dag.csv rows, load_dot the "A" -> "B"
+  edges and "A"; node statements of a Graphviz file like docs/deps/psi_dag.gv
+"""
+from __future__ import annotations
+
+import csv
+import re
+from collections import deque
+from pathlib import Path
+
+DOT_ID_RE = re.compile(r'"([^"]+)"')
+DOT_NODE_RE = re.compile(r'^\s*"([^"]+)"\s*(?:\[[^\]]*\])?\s*;?\s*$')
+
+
+class ProofDag:
+    """Directed graph over lemma IDs with O(V+E) order and cycle queries."""
+
+    def __init__(self):
+        self.ids: list[str] = []
+        self.index: dict[str, int] = {}
+        self.succ: list[list[int]] = []
+        self.pred: list[list[int]] = []
+        self._edges: set[tuple[int, int]] = set()
+        self._pos: list[int] | None = None  # topological position per node, when known
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self._edges)
+
+    def add_node(self, node: str) -> int:
+        i = self.index.get(node)
+        if i is None:
+            i = self.index[node] = len(self.ids)
+            self.ids.append(node)
+            self.succ.append([])
+            self.pred.append([])
+            if self._pos is not None:
+                self._pos.append(i)  # an isolated node can go last
+        return i
+
+    def add_edge(self, a: str, b: str) -> list[str] | None:
+        """Add a -> b (once). Returns the cycle it closes as [b, ..., a], else None."""
+        u, v = self.add_node(a), self.add_node(b)
+        if (u, v) in self._edges:
+            return None
+        self._edges.add((u, v))
+        self.succ[u].append(v)
+        self.pred[v].append(u)
+        if u == v:
+            self._pos = None
+            return [a]
+        if self._pos is None or self._pos[u] < self._pos[v]:
+            return None
+        cycle = self._reorder(u, v)
+        if cycle is not None:
+            self._pos = None
+            return [self.ids[i] for i in cycle]
+        return None
+
+    def _reorder(self, u: int, v: int) -> list[int] | None:
+        """Pearce-Kelly repair of positions after adding u -> v with pos[v] < pos[u]."""
+        pos = self._pos
+        lb, ub = pos[v], pos[u]
+        forward, parent = [], {v: v}
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            forward.append(x)
+            for y in self.succ[x]:
+                if y == u:
+                    path = [x]  # v ~> x -> u; the new edge u -> v closes it
+                    while path[-1] != v:
+                        path.append(parent[path[-1]])
+                    return path[::-1] + [u]
+                if y not in parent and pos[y] < ub:
+                    parent[y] = x
+                    stack.append(y)
+        backward, seen = [], {u}
+        stack = [u]
+        while stack:
+            x = stack.pop()
+            backward.append(x)
+            for y in self.pred[x]:
+                if y not in seen and pos[y] > lb:
+                    seen.add(y)
+                    stack.append(y)
+        backward.sort(key=pos.__getitem__)
+        forward.sort(key=pos.__getitem__)
+        nodes = backward + forward
+        for x, p in zip(nodes, sorted(pos[x] for x in nodes)):
+            pos[x] = p
+        return None
+
+    def topological_order(self) -> list[str] | None:
+        """IDs so that every edge points forward; None if the graph has a cycle."""
+        if self._pos is None:
+            indeg = [len(p) for p in self.pred]
+            queue = deque(i for i, d in enumerate(indeg) if d == 0)
+            order: list[int] = []
+            while queue:
+                x = queue.popleft()
+                order.append(x)
+                for y in self.succ[x]:
+                    indeg[y] -= 1
+                    if indeg[y] == 0:
+                        queue.append(y)
+            if len(order) < len(self.ids):
+                return None
+            self._pos = [0] * len(self.ids)
+            for p, x in enumerate(order):
+                self._pos[x] = p
+        order = [0] * len(self.ids)
+        for x, p in enumerate(self._pos):
+            order[p] = x
+        return [self.ids[x] for x in order]
+
+    def components(self) -> list[list[int]]:
+        """Strongly connected components (Tarjan, iterative), in reverse topological order."""
+        n = len(self.ids)
+        low, num = [0] * n, [-1] * n
+        on_stack = [False] * n
+        stack: list[int] = []
+        comps: list[list[int]] = []
+        counter = 0
+        for root in range(n):
+            if num[root] != -1:
+                continue
+            work = [(root, 0)]
+            num[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                x, i = work[-1]
+                succ = self.succ[x]
+                if i < len(succ):
+                    work[-1] = (x, i + 1)
+                    y = succ[i]
+                    if num[y] == -1:
+                        num[y] = low[y] = counter
+                        counter += 1
+                        stack.append(y)
+                        on_stack[y] = True
+                        work.append((y, 0))
+                    elif on_stack[y]:
+                        low[x] = min(low[x], num[y])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[x])
+                if low[x] == num[x]:
+                    comp = []
+                    while True:
+                        y = stack.pop()
+                        on_stack[y] = False
+                        comp.append(y)
+                        if y == x:
+                            break
+                    comps.append(comp)
+        return comps
+
+    def cycles(self) -> list[list[str]]:
+        """Member IDs (in node order) of every cyclic component, including self-loops."""
+        out = []
+        for comp in self.components():
+            if len(comp) > 1 or (comp[0], comp[0]) in self._edges:
+                out.append([self.ids[i] for i in sorted(comp)])
+        return sorted(out, key=lambda ids: self.index[ids[0]])
+
+
+def load_csv(path: Path, dag: ProofDag | None = None) -> ProofDag:
+    """Edges From -> To of every row of a proof_dag.csv-style table."""
+    dag = ProofDag() if dag is None else dag
+    with Path(path).open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            dag.add_edge(row["From"] or "", row["To"] or "")
+    return dag
+
+
+def load_dot(path: Path, dag: ProofDag | None = None) -> ProofDag:
+    """Quoted node statements and "A" -> "B" edges (chains included) of a DOT file."""
+    dag = ProofDag() if dag is None else dag
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split("//", 1)[0]
+        if "->" in line:
+            ids = DOT_ID_RE.findall(line.split("[", 1)[0])  # "A" -> "B" -> "C" [attrs];
+            for a, b in zip(ids, ids[1:]):
+                dag.add_edge(a, b)
+        else:
+            m = DOT_NODE_RE.match(line)
+            if m:
+                dag.add_node(m.group(1))
+    return dag
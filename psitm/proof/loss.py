@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Loss-expression algebra for the proof tables and its propagation over the proof DAG.
+
+- A Loss is a monomial over BASES (d, k, M, log2 n, log2 M, B(d,n)); each
+  exponent is an Exponent: a number plus integer/rational multiples of
+  symbols (α, β, a, b, ...), kept exact with fractions.Fraction
+- Composing two losses multiplies the monomials, i.e. adds exponents
+  symbolically (a + b, α - 1, ...); zero exponents are dropped, so equal
+  losses compare (and hash) equal however they were written
+- parse_loss reads both table spellings: "(log_2 M)^1 × (B(d,n))^-1"
+  (proof_dag.csv) and "(d^a)*(k^b)*(log2(n)^a+b)" (bridges); an optional
+  $...$ wrapper is ignored, anything else raises ValueError
+- propagate walks a ProofDag once in topological order and keeps one
+  canonical path per node: its source (in-degree 0) node and the loss
+  composed along it, taken over from the first incoming edge that carries a
+  loss. Every later incoming edge whose tail has the same source is checked
+  against it; a disagreement flags that edge, and its declared loss is
+  reported next to the loss the canonical path implies. Edges from another
+  source's paths are not compared, so two paths from one source are only
+  checked against each other where they meet at a node whose canonical path
+  comes from that source. One Loss product per edge: O(V + E)
+"""
+from __future__ import annotations
+
+import re
+from fractions import Fraction
+from typing import NamedTuple
+
+from .dag import ProofDag
+
+BASES = ("d", "k", "M", "log2 n", "log2 M", "B(d,n)")
+BASE_NAMES = {  # spaces and underscores removed before lookup
+    "d": "d", "k": "k", "M": "M",
+    "log2n": "log2 n", "log2(n)": "log2 n",
+    "log2M": "log2 M", "log2(M)": "log2 M",
+    "B(d,n)": "B(d,n)",
+}
+BASE_TEX = {"log2 n": "log_2 n", "log2 M": "log_2 M", "B(d,n)": "B(d,n)"}
+
+EXP_TERM_RE = re.compile(r"([+-])?(\d+(?:/\d+)?)?([^\W\d]\w*)?")
+PAREN_EXP_RE = re.compile(r"^\((?P<base>.*)\)\^(?P<exp>[^)]*|\(.*\))$")  # (B(d,n))^-1
+INNER_EXP_RE = re.compile(r"^\((?P<base>[^^]+)\^(?P<exp>.+)\)$")        # (log2(n)^a+b)
+
+
+class Exponent:
+    """const + sum(coef * symbol), exact."""
+
+    __slots__ = ("const", "terms")
+
+    def __init__(self, const=0, terms: dict[str, Fraction] | None = None):
+        self.const = Fraction(const)
+        self.terms = tuple(sorted((s, Fraction(c)) for s, c in (terms or {}).items() if c))
+
+    @classmethod
+    def parse(cls, text: str) -> "Exponent":
+        s = text.replace(" ", "").replace("−", "-")
+        while s.startswith("(") and s.endswith(")"):
+            s = s[1:-1]
+        if not s:
+            raise ValueError(f"empty exponent: {text!r}")
+        const, terms, pos = Fraction(0), {}, 0
+        while pos < len(s):
+            m = EXP_TERM_RE.match(s, pos)
+            sign, num, sym = m.groups()
+            if m.end() == pos or not (num or sym) or (pos and not sign):
+                raise ValueError(f"bad exponent: {text!r}")
+            coef = Fraction(num or 1) * (-1 if sign == "-" else 1)
+            if sym:
+                terms[sym] = terms.get(sym, 0) + coef
+            else:
+                const += coef
+            pos = m.end()
+        return cls(const, terms)
+
+    def _key(self):
+        return self.const, self.terms
+
+    def __eq__(self, other):
+        return isinstance(other, Exponent) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __bool__(self):
+        return bool(self.const) or bool(self.terms)
+
+    def __add__(self, other: "Exponent") -> "Exponent":
+        terms = dict(self.terms)
+        for s, c in other.terms:
+            terms[s] = terms.get(s, 0) + c
+        return Exponent(self.const + other.const, terms)
+
+    def __neg__(self) -> "Exponent":
+        return Exponent(-self.const, {s: -c for s, c in self.terms})
+
+    def __sub__(self, other: "Exponent") -> "Exponent":
+        return self + (-other)
+
+    def __str__(self):
+        parts = []
+        for s, c in self.terms:
+            coef = "" if abs(c) == 1 else str(abs(c))
+            parts.append(("-" if c < 0 else "+") + coef + s)
+        if self.const or not parts:
+            parts.append(("-" if self.const < 0 else "+") + str(abs(self.const)))
+        out = "".join(parts)
+        return out[1:] if out.startswith("+") else out
+
+    def __repr__(self):
+        return f"Exponent({str(self)!r})"
+
+
+class Loss:
+    """Monomial prod(base ** exponent) over BASES."""
+
+    __slots__ = ("exps",)
+
+    def __init__(self, exps: dict[str, Exponent] | None = None):
+        self.exps = {b: e for b, e in (exps or {}).items() if e}
+        unknown = set(self.exps) - set(BASES)
+        if unknown:
+            raise ValueError(f"unknown loss base(s): {sorted(unknown)}")
+
+    def exponent(self, base: str) -> Exponent:
+        return self.exps.get(base, Exponent())
+
+    def _key(self):
+        return tuple((b, self.exps[b]) for b in BASES if b in self.exps)
+
+    def __eq__(self, other):
+        return isinstance(other, Loss) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __mul__(self, other: "Loss") -> "Loss":
+        return Loss({b: self.exponent(b) + other.exponent(b) for b in BASES})
+
+    def __truediv__(self, other: "Loss") -> "Loss":
+        return Loss({b: self.exponent(b) - other.exponent(b) for b in BASES})
+
+    def __str__(self):
+        if not self.exps:
+            return "1"
+        parts = []
+        for b in BASES:
+            if b in self.exps:
+                e = str(self.exps[b])
+                if "+" in e or "-" in e[1:]:
+                    e = f"({e})"
+                parts.append(f"({BASE_TEX.get(b, b)})^{e}")
+        return " × ".join(parts)
+
+    def __repr__(self):
+        return f"Loss({str(self)!r})"
+
+
+ONE = Loss()
+
+
+def _factors(text: str) -> list[str]:
+    """Split at top-level × or *."""
+    out, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0 and ch in "×*":
+            out.append(text[start:i])
+            start = i + 1
+    out.append(text[start:])
+    return [f.strip() for f in out]
+
+
+def parse_loss(text: str) -> Loss:
+    s = text.strip()
+    if s.startswith("$") and s.endswith("$"):
+        s = s[1:-1].strip()
+    if s == "1":
+        return ONE
+    exps: dict[str, Exponent] = {}
+    for factor in _factors(s):
+        m = PAREN_EXP_RE.match(factor) or INNER_EXP_RE.match(factor)
+        if m:
+            base, exp = m.group("base"), Exponent.parse(m.group("exp"))
+        elif "^" in factor:
+            base, _, raw = factor.partition("^")
+            exp = Exponent.parse(raw)
+        else:
+            base, exp = factor, Exponent(1)
+            if base.startswith("(") and base.endswith(")"):
+                base = base[1:-1]
+        name = BASE_NAMES.get(base.replace(" ", "").replace("_", ""))
+        if name is None:
+            raise ValueError(f"unknown loss factor {factor!r} in {text!r}")
+        exps[name] = exps.get(name, Exponent()) + exp
+    return Loss(exps)
+
+
+class Mismatch(NamedTuple):
+    edge: tuple[str, str]  # (From, To) whose declared loss disagrees
+    declared: Loss
+    composed: Loss         # what the earlier path from source implies for this edge
+    source: str
+
+
+def propagate(dag: ProofDag, losses: dict[tuple[str, str], Loss]) -> tuple[dict[str, tuple[str, Loss]], list[Mismatch]]:
+    """({node: (source, loss composed along its canonical path)}, mismatches) in one topological pass.
+
+    Edges without an entry in losses do not carry any path; nodes no such
+    path reaches are absent. dag must be acyclic.
+    """
+    order = dag.topological_order()
+    if order is None:
+        raise ValueError("loss propagation needs an acyclic graph")
+    canonical: dict[str, tuple[str, Loss]] = {}
+    mismatches: list[Mismatch] = []
+    for node in order:
+        i = dag.index[node]
+        if not dag.pred[i]:
+            canonical[node] = (node, ONE)
+            continue
+        for j in dag.pred[i]:
+            u = dag.ids[j]
+            declared = losses.get((u, node))
+            if declared is None or u not in canonical:
+                continue
+            source, loss = canonical[u]
+            here = canonical.get(node)
+            if here is None:
+                canonical[node] = (source, loss * declared)
+            elif here[0] == source and here[1] != loss * declared:
+                mismatches.append(Mismatch((u, node), declared, here[1] / loss, source))
+    return canonical, mismatches
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Simulation engines for the stress_firebreak experiments."""
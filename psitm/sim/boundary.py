@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Phase-boundary tracing for the stress_firebreak budget model.
+
+- The pass probability 1/(1+exp(-alpha*(B-R_eff))) is evaluated on continuous
+  d, extra and n (B = c*d*log2 n, R_eff = a*k*log2 n*(1+gamma*(extra-1)))
+- For each k and each point of a fine (extra, n) or (d, n) mesh, the level-p
+  contour is located by vectorized bisection on the free axis (d or extra);
+  every mesh point is refined at once, so cost is O(mesh x log2(span/tol))
+- n is meshed log2-uniformly between the grid's min and max n, the other axis
+  linearly between its grid min and max
+- Points whose bracket [lo, hi] has no sign change get NaN (no transition in range)
+- At p = 0.5 the contour is B = R_eff and log2 n cancels:
+  d* = a*k*(1+gamma*(extra-1))/c for every n; other levels shift it by
+  logit(p)/(alpha*c*log2 n)
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml  # type: ignore
+
+from .columnar import write_table
+from .stress import StressConfig, budget_model
+
+AXES = ("d", "extra")
+BOUNDS = (0.0, 256.0)
+TABLE_NAME = "phase_boundary"
+CONFIG_NAME = "phase_boundary_config.yaml"
+
+
+def mesh_axis(values: tuple[int, ...], points: int, log2: bool = False) -> np.ndarray:
+    """points values spanning [min(values), max(values)]; log2-uniform when log2=True."""
+    lo, hi = float(min(values)), float(max(values))
+    if points <= 1 or lo == hi:
+        return np.array([lo])
+    if log2:
+        return 2.0 ** np.linspace(np.log2(lo), np.log2(hi), points)
+    return np.linspace(lo, hi, points)
+
+
+def bisect_level(cfg: StressConfig, axis: str, fixed: dict[str, np.ndarray], level: np.ndarray,
+                 bounds: tuple[float, float] = BOUNDS, tol: float = 1e-9,
+                 max_iter: int = 200) -> tuple[np.ndarray, int]:
+    """Root of prob - level along `axis` for every broadcast point of `fixed`; returns (x, iterations)."""
+    if axis not in AXES:
+        raise ValueError(f"unknown axis: {axis}")
+
+    def excess(x: np.ndarray) -> np.ndarray:
+        return budget_model(cfg, **fixed, **{axis: x})[2] - level
+
+    shape = np.broadcast_shapes(np.shape(level), *(np.shape(v) for v in fixed.values()))
+    lo = np.full(shape, float(bounds[0]))
+    hi = np.full(shape, float(bounds[1]))
+    f_lo, f_hi = excess(lo), excess(hi)
+    bracketed = np.sign(f_lo) != np.sign(f_hi)
+    iters = 0
+    while iters < max_iter and np.max(hi - lo, initial=0.0) > tol:
+        mid = 0.5 * (lo + hi)
+        f_mid = excess(mid)
+        left = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(left, mid, lo)
+        f_lo = np.where(left, f_mid, f_lo)
+        hi = np.where(left, hi, mid)
+        iters += 1
+    return np.where(bracketed, 0.5 * (lo + hi), np.nan), iters
+
+
+def trace_boundary(cfg: StressConfig, axis: str = "d", levels=(0.5,), points: int = 65,
+                   bounds: tuple[float, float] = BOUNDS, tol: float = 1e-9) -> pd.DataFrame:
+    """Level contours per k over a points x points mesh of the two remaining continuous axes."""
+    if axis not in AXES:
+        raise ValueError(f"unknown axis: {axis}")
+    bad = [p for p in levels if not 0.0 < p < 1.0]
+    if bad:
+        raise ValueError(f"levels must lie in (0, 1): {bad}")
+    other = "extra" if axis == "d" else "d"
+    mesh = np.meshgrid(
+        np.asarray(levels, dtype=float),
+        np.asarray(cfg.k, dtype=float),
+        mesh_axis(getattr(cfg, other), points),
+        mesh_axis(cfg.n, points, log2=True),
+        indexing="ij",
+    )
+    level, k, fixed_other, n = (m.ravel() for m in mesh)
+    x, _ = bisect_level(cfg, axis, {"k": k, other: fixed_other, "n": n}, level, bounds, tol)
+    values = {"k": k, axis: x, other: fixed_other, "n": n}
+    B, R_eff, prob = budget_model(cfg, **values)
+    return pd.DataFrame({
+        "level": level,
+        "k": k.astype(np.int64),
+        "d": values["d"],
+        "extra": values["extra"],
+        "n": n,
+        "log2_n": np.log2(n),
+        "B": B,
+        "R_eff": R_eff,
+        "prob": prob,
+    })
+
+
+def write_boundary(cfg: StressConfig, out_dir: Path, commit: str | None = None, axis: str = "d",
+                   levels=(0.5,), points: int = 65, bounds: tuple[float, float] = BOUNDS,
+                   tol: float = 1e-9, formats=("csv",)) -> pd.DataFrame:
+    """Trace the contours and write phase_boundary.<fmt> plus phase_boundary_config.yaml."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    df = trace_boundary(cfg, axis, levels, points, bounds, tol)
+    for fmt in formats:
+        write_table(df, out_dir / TABLE_NAME, fmt)
+    data = cfg.to_dict(commit)
+    data["boundary"] = {
+        "axis": axis, "levels": [float(p) for p in levels], "points": int(points),
+        "bounds": [float(b) for b in bounds], "tol": float(tol),
+    }
+    with open(out_dir / CONFIG_NAME, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+    return df
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed store of per-cell stress aggregates.
+
+- Each (k, d, extra, n) cell is keyed on the SHA-256 of its parameters plus
+  T, seed, the budget-model params (c, a, gamma, alpha) and ENGINE_VERSION;
+  adaptive runs also key on their stopping rule (half_width, max_T, batch)
+- A record holds the trial count N and the success count of pass_prob; the
+  deterministic columns (pass_det, collision) are recomputed from the model.
+  Records written by raw-mode sweeps also carry the cell's T pass_prob draws
+  (np.packbits, little bit order, hex), so raw tables can be rebuilt from
+  the store; lookup_trials only hits such records
+- Records live under <root>/<key[:2]>/<key>.json and are shared by every
+  dated results folder, so re-runs only compute cells that are missing
+- import_results backfills the store from earlier results/<DATE>/stress_firebreak/
+  folders (config.yaml + stress_matrix_agg.csv)
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from ..yamlio import safe_load
+from .stress import ENGINE_VERSION, KEYS, StressConfig, grid_model
+
+
+def cell_key(cfg: StressConfig, cell: tuple[int, int, int, int], sampling: dict | None = None) -> str:
+    payload = {
+        "engine": ENGINE_VERSION,
+        "cell": [int(v) for v in cell],
+        "T": cfg.T,
+        "seed": cfg.seed,
+        "params": {"c": cfg.c, "a": cfg.a, "gamma": cfg.gamma, "alpha": cfg.alpha},
+    }
+    if sampling is not None:
+        payload["adaptive"] = sampling
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+class ResultStore:
+    """Directory of per-cell aggregate records keyed by cell_key."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        p = self._path(key)
+        if not p.exists():
+            return None
+        try:
+            return json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, record: dict) -> None:
+        p = self._path(key)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, p)
+
+    def lookup(self, cfg: StressConfig, model: dict[str, np.ndarray],
+               sampling: dict | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(N, successes, hit mask) per grid cell; misses have N = successes = 0."""
+        num_cells = len(model["prob"])
+        n_tot = np.zeros(num_cells, dtype=np.int64)
+        s_prob = np.zeros(num_cells, dtype=np.int64)
+        hit = np.zeros(num_cells, dtype=bool)
+        for i in range(num_cells):
+            rec = self.get(cell_key(cfg, tuple(model[key][i] for key in KEYS), sampling))
+            if rec is not None:
+                n_tot[i], s_prob[i], hit[i] = rec["N"], rec["s_prob"], True
+        return n_tot, s_prob, hit
+
+    def lookup_trials(self, cfg: StressConfig, model: dict[str, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """((cells, T) pass_prob draws, hit mask) from records that stored their trials."""
+        num_cells = len(model["prob"])
+        passes = np.zeros((num_cells, cfg.T), dtype=bool)
+        hit = np.zeros(num_cells, dtype=bool)
+        for i in range(num_cells):
+            rec = self.get(cell_key(cfg, tuple(model[key][i] for key in KEYS)))
+            if rec is not None and "passes" in rec and rec["N"] == cfg.T:
+                bits = np.frombuffer(bytes.fromhex(rec["passes"]), dtype=np.uint8)
+                passes[i] = np.unpackbits(bits, count=cfg.T, bitorder="little").astype(bool)
+                hit[i] = True
+        return passes, hit
+
+    def save(self, cfg: StressConfig, model: dict[str, np.ndarray], index: np.ndarray,
+             n_tot: np.ndarray, s_prob: np.ndarray, sampling: dict | None = None,
+             passes: np.ndarray | None = None) -> None:
+        """Store the cells in index; passes (len(index), T) also keeps their trials."""
+        for j, (i, N, s) in enumerate(zip(index, n_tot, s_prob)):
+            cell = tuple(int(model[key][i]) for key in KEYS)
+            record = {
+                "cell": dict(zip(KEYS, cell)), "T": cfg.T, "seed": cfg.seed,
+                "params": {"c": cfg.c, "a": cfg.a, "gamma": cfg.gamma, "alpha": cfg.alpha},
+                "engine": ENGINE_VERSION, "N": int(N), "s_prob": int(s),
+            }
+            if sampling is not None:
+                record["adaptive"] = sampling
+            if passes is not None:
+                record["passes"] = np.packbits(passes[j], bitorder="little").tobytes().hex()
+            self.put(cell_key(cfg, cell, sampling), record)
+
+
+def import_results(store: ResultStore, results_root: Path) -> int:
+    """Backfill the store from results/<DATE>/stress_firebreak/ folders; returns records added.
+
+    Folders without an engine version in config.yaml predate the engine and
+    came from the notebook loops, which ENGINE_VERSION 1 reproduces.
+    """
+    added = 0
+    for cfg_path in sorted(Path(results_root).glob("*/stress_firebreak/config.yaml")):
+        agg_path = cfg_path.parent / "stress_matrix_agg.csv"
+        if not agg_path.exists():
+            continue
+        data = safe_load(cfg_path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            continue
+        version = (data.get("engine") or {}).get("version", 1)
+        if version != ENGINE_VERSION:
+            continue
+        cfg = StressConfig.from_dict(data)
+        model = grid_model(cfg)
+        index = {tuple(int(model[key][i]) for key in KEYS): i for i in range(len(model["prob"]))}
+        rows, n_tot, s_prob = [], [], []
+        with agg_path.open(newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                cell = tuple(int(row[key]) for key in KEYS)
+                N = int(row["N"])
+                if cell not in index or N != cfg.T:
+                    continue
+                key = cell_key(cfg, cell)
+                if store.get(key) is not None:
+                    continue
+                rows.append(index[cell])
+                n_tot.append(N)
+                s_prob.append(round(float(row["pass_rate_prob"]) * N))
+        store.save(cfg, model, np.asarray(rows, dtype=np.int64), n_tot, s_prob)
+        added += len(rows)
+    return added
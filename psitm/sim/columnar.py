@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar read/write for stress_firebreak result tables.
+
+Formats:
+- csv: pandas text export (unchanged layout; read back with round-trip floats)
+- npy: directory <stem>.cols/ with one .npy file per column plus columns.json;
+  memory-mappable with np.load(mmap_mode="r")
+- npz: <stem>.npz, the same columns zip-compressed (smallest numpy-only
+  option; loaded into memory, not mapped)
+- parquet: <stem>.parquet via pandas/pyarrow (optional dependency)
+
+Integer columns (k, d, extra, n, trial, N, pass_det, pass_prob, exact) are
+narrowed to the smallest signed dtype that holds their range; bool columns
+stay np.bool_ (as pandas reads them back from csv) and float columns stay
+float64, so values round-trip bit for bit.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FORMATS = ("csv", "npy", "npz", "parquet")
+SUFFIXES = {"csv": ".csv", "npy": ".cols", "npz": ".npz", "parquet": ".parquet"}
+INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def narrow_int_dtype(values: np.ndarray) -> np.dtype:
+    """Smallest signed integer dtype holding every value (int8 for empty arrays)."""
+    if values.size == 0:
+        return np.dtype(np.int8)
+    lo, hi = int(values.min()), int(values.max())
+    for dt in INT_DTYPES:
+        info = np.iinfo(dt)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dt)
+    return np.dtype(np.int64)
+
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df with integer columns narrowed to compact dtypes; bool and float columns unchanged."""
+    cols = {}
+    for name in df.columns:
+        values = df[name].to_numpy()
+        if np.issubdtype(values.dtype, np.integer):
+            values = values.astype(narrow_int_dtype(values))
+        cols[name] = values
+    return pd.DataFrame(cols)
+
+
+def table_path(stem: Path, fmt: str) -> Path:
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format: {fmt}")
+    stem = Path(stem)
+    return stem.with_name(stem.name + SUFFIXES[fmt])
+
+
+def write_table(df: pd.DataFrame, stem: Path, fmt: str = "csv") -> Path:
+    """Write df as <stem>.csv, <stem>.cols/, <stem>.npz or <stem>.parquet; returns the path."""
+    path = table_path(stem, fmt)
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+        return path
+    small = compact(df)
+    if fmt == "parquet":
+        try:
+            small.to_parquet(path, index=False)
+        except ImportError as e:
+            raise RuntimeError(f"parquet output needs pyarrow: {e}") from e
+        return path
+    if fmt == "npz":
+        # np.savez_compressed keeps keyword order, which read_table relies on
+        np.savez_compressed(path, **{name: small[name].to_numpy() for name in small.columns})
+        return path
+    path.mkdir(parents=True, exist_ok=True)
+    for name in small.columns:
+        np.save(path / f"{name}.npy", small[name].to_numpy(), allow_pickle=False)
+    (path / "columns.json").write_text(json.dumps(list(small.columns)), encoding="utf-8")
+    return path
+
+
+def read_columns(path: Path, mmap: bool = True) -> dict[str, np.ndarray]:
+    """Columns of a .cols/ directory as (memory-mapped) arrays, in file order."""
+    path = Path(path)
+    names = json.loads((path / "columns.json").read_text(encoding="utf-8"))
+    mode = "r" if mmap else None
+    return {name: np.load(path / f"{name}.npy", mmap_mode=mode, allow_pickle=False) for name in names}
+
+
+def read_table(path: Path, mmap: bool = True) -> pd.DataFrame:
+    """Load a table written by write_table; the format follows the path suffix."""
+    path = Path(path)
+    if path.suffix == ".cols":
+        return pd.DataFrame(read_columns(path, mmap), copy=False)
+    if path.suffix == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            return pd.DataFrame({name: data[name] for name in data.files}, copy=False)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, float_precision="round_trip")
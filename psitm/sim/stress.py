@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized engine for the stress_firebreak full-factorial sweeps.
+
+- Grid and budget-model parameters mirror notebooks/stress_firebreak/*.ipynb
+  and the config.yaml files they write next to the results
+- B, R_eff, the logistic pass probability and the collision proxy are
+  evaluated for the whole (k, d, extra, n) grid as arrays
+- Each cell draws its T Bernoulli trials in one batched call on
+  stable_rng(seed, k, d, extra, n); Generator.random(T) yields the same stream
+  as T scalar rng.random() calls, so raw/agg CSVs are bit-identical to the
+  per-trial notebook loops
+- Cells are independent by construction, so draw_grid can shard them over a
+  process pool; results are merged in grid order and do not depend on the
+  number of workers
+- Aggregate-only mode (count_grid) streams each cell's trials in chunks and
+  keeps only success counts, so memory is O(grid) rather than O(grid x T)
+- Adaptive mode (adapt_grid) keeps sampling a cell in batches until its Wilson
+  CI half-width reaches a target or a max-T cap; N records the trials used
+- pass_det and collision are cell-invariant and never sampled; with
+  exact=True, cells whose logistic prob is saturated (see saturated) get
+  exact aggregates without drawing and are marked in an `exact` column
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml  # type: ignore
+
+from ..yamlio import safe_load
+from .columnar import write_table
+
+# Bump whenever a change alters drawn trials or aggregates for the same
+# config; cached cells from other versions are then recomputed. Version 1
+# is bit-identical to the 2025-08-28 notebook loops.
+ENGINE_VERSION = 1
+
+KEYS = ("k", "d", "extra", "n")
+MODES = ("raw", "agg", "adaptive")
+CHUNK = 1 << 16  # trials per cell drawn at once in aggregate-only mode
+# rng.random() returns multiples of 2**-53 in [0, 1); for prob <= 2**-53
+# (or >= 1 - 2**-53) `u < prob` is decided for every draw except u == 0.0
+# (or u == 1 - 2**-53), an event of probability 2**-53 per trial
+SATURATION = 2.0**-53
+EXPERIMENTS = ("stress_matrix", "phase_weird")
+CONFIG_NAMES = {
+    "stress_matrix": "config.yaml",
+    "phase_weird": "phase_weird_config.yaml",
+}
+
+
+def stable_rng(seed_base: int, *keys: int) -> np.random.Generator:
+    """Deterministic per-cell RNG using stable hash (independent of Python hash seed)."""
+    s = ":".join(map(str, keys)).encode("utf-8")
+    h = int(hashlib.sha256(s).hexdigest(), 16) % (2**31 - 1)
+    return np.random.default_rng(seed_base + h)
+
+
+def git_commit(root: Path | None = None) -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+@dataclass(frozen=True)
+class StressConfig:
+    """Grid, trial count, seed and budget-model params (config.yaml layout)."""
+    k: tuple[int, ...] = (2, 3, 4)
+    d: tuple[int, ...] = (1, 2, 3)
+    extra: tuple[int, ...] = (1, 2, 4)
+    n: tuple[int, ...] = tuple(2**p for p in range(6, 14))
+    T: int = 200
+    seed: int = 1337
+    c: float = 1.0       # budget constant
+    a: float = 1.0       # requirement constant
+    gamma: float = 0.5   # inflation per extra-1
+    alpha: float = 1.5   # logistic steepness
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StressConfig":
+        params = data.get("params") or {}
+        base = cls()
+        return cls(
+            k=tuple(int(v) for v in data.get("k", base.k)),
+            d=tuple(int(v) for v in data.get("d", base.d)),
+            extra=tuple(int(v) for v in data.get("extra", base.extra)),
+            n=tuple(int(v) for v in data.get("n", base.n)),
+            T=int(data.get("T", base.T)),
+            seed=int(data.get("seed", base.seed)),
+            c=float(params.get("c", base.c)),
+            a=float(params.get("a", base.a)),
+            gamma=float(params.get("gamma", base.gamma)),
+            alpha=float(params.get("alpha", base.alpha)),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "StressConfig":
+        data = safe_load(Path(path).read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: stress config must be a mapping")
+        return cls.from_dict(data)
+
+    def to_dict(self, commit: str | None = None) -> dict:
+        return {
+            "k": list(self.k),
+            "d": list(self.d),
+            "extra": list(self.extra),
+            "n": list(self.n),
+            "T": self.T,
+            "seed": self.seed,
+            "params": {"c": self.c, "a": self.a, "gamma": self.gamma, "alpha": self.alpha},
+            "engine": {"version": ENGINE_VERSION},
+            "git": {"commit": commit if commit is not None else git_commit()},
+        }
+
+    def cells(self) -> np.ndarray:
+        """(num_cells, 4) int64 array of (k, d, extra, n) in notebook loop order."""
+        mesh = np.meshgrid(self.k, self.d, self.extra, self.n, indexing="ij")
+        return np.stack([m.ravel() for m in mesh], axis=1).astype(np.int64)
+
+
+def budget_model(cfg: StressConfig, k, d, extra, n) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(B, R_eff, prob) for broadcastable k, d, extra, n; continuous values are allowed."""
+    log_n = np.log2(n)
+    B = cfg.c * d * log_n
+    R = cfg.a * k * log_n
+    R_eff = R * (1.0 + cfg.gamma * (extra - 1))
+    with np.errstate(over="ignore"):
+        prob = 1.0 / (1.0 + np.exp(-cfg.alpha * (B - R_eff)))
+    return B, R_eff, prob
+
+
+def grid_model(cfg: StressConfig) -> dict[str, np.ndarray]:
+    """Evaluate the budget model for every cell: B, R_eff, prob, det, collision."""
+    cells = cfg.cells()
+    k, d, extra, n = (cells[:, i] for i in range(4))
+    B, R_eff, prob = budget_model(cfg, k, d, extra, n)
+    return {
+        "k": k, "d": d, "extra": extra, "n": n,
+        "B": B, "R_eff": R_eff, "prob": prob,
+        "det": (B >= R_eff).astype(np.int64),
+        # proxy for "collision": higher when B<R_eff
+        "collision": np.maximum(0.0, (R_eff - B) / np.maximum(1.0, R_eff)),
+    }
+
+
+def saturated(prob: np.ndarray) -> np.ndarray:
+    """Cells whose Bernoulli outcome is fixed up to float precision (see SATURATION)."""
+    return (prob <= SATURATION) | (prob >= 1.0 - SATURATION)
+
+
+def draw_cells(cfg: StressConfig, model: dict[str, np.ndarray],
+               index: np.ndarray | None = None) -> np.ndarray:
+    """Bernoulli(prob) outcomes, shape (len(index), T), one batched draw per cell."""
+    if index is None:
+        index = np.arange(len(model["prob"]))
+    out = np.empty((len(index), cfg.T), dtype=bool)
+    for row, i in enumerate(index):
+        rng = stable_rng(cfg.seed, *(int(model[key][i]) for key in KEYS))
+        out[row] = rng.random(cfg.T) < model["prob"][i]
+    return out
+
+
+def count_cells(cfg: StressConfig, model: dict[str, np.ndarray],
+                index: np.ndarray | None = None, chunk: int = CHUNK,
+                sample: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Success counts per cell, drawn `chunk` trials at a time.
+
+    Chunked rng.random calls continue the same stream as draw_cells, so the
+    counts match the raw mode exactly. Also returns the first `sample`
+    outcomes of each cell, shape (len(index), min(sample, T)).
+    """
+    if index is None:
+        index = np.arange(len(model["prob"]))
+    keep = min(sample, cfg.T)
+    s_prob = np.zeros(len(index), dtype=np.int64)
+    head = np.empty((len(index), keep), dtype=bool)
+    for row, i in enumerate(index):
+        rng = stable_rng(cfg.seed, *(int(model[key][i]) for key in KEYS))
+        done = 0
+        while done < cfg.T:
+            hits = rng.random(min(chunk, cfg.T - done)) < model["prob"][i]
+            if done < keep:
+                take = min(keep - done, len(hits))
+                head[row, done:done + take] = hits[:take]
+            s_prob[row] += int(np.count_nonzero(hits))
+            done += len(hits)
+    return s_prob, head
+
+
+def adapt_cells(cfg: StressConfig, model: dict[str, np.ndarray],
+                index: np.ndarray | None = None, half_width: float = 0.01,
+                max_T: int = 100_000, batch: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Sequential sampling per cell; returns (trials used, successes).
+
+    Draws `batch` trials at a time (cfg.T if 0) on the cell's stable_rng
+    until the Wilson CI half-width is <= half_width or max_T trials are
+    used. The first N trials are the same draws the fixed-T modes see.
+    """
+    if index is None:
+        index = np.arange(len(model["prob"]))
+    batch = batch or cfg.T
+    n_tot = np.zeros(len(index), dtype=np.int64)
+    s_prob = np.zeros(len(index), dtype=np.int64)
+    for row, i in enumerate(index):
+        rng = stable_rng(cfg.seed, *(int(model[key][i]) for key in KEYS))
+        N = s = 0
+        while N < max_T:
+            hits = rng.random(min(batch, max_T - N)) < model["prob"][i]
+            s += int(np.count_nonzero(hits))
+            N += len(hits)
+            if _ci_done(s, N, half_width):
+                break
+        n_tot[row], s_prob[row] = N, s
+    return n_tot, s_prob
+
+
+def _ci_done(s: int, N: int, half_width: float) -> bool:
+    _, lo, hi = wilson_ci(s, N)
+    return (hi - lo) / 2 <= half_width
+
+
+def adapt_exact_n(passing: bool, half_width: float = 0.01, max_T: int = 100_000, batch: int = 200) -> int:
+    """Trials adapt_cells would use on a saturated cell (all or no trials passing)."""
+    N = 0
+    while N < max_T:
+        N += min(batch, max_T - N)
+        if _ci_done(N if passing else 0, N, half_width):
+            break
+    return N
+
+
+def _draw_shard(args: tuple[StressConfig, np.ndarray]) -> np.ndarray:
+    cfg, index = args
+    return draw_cells(cfg, grid_model(cfg), index)
+
+
+def _count_shard(args: tuple[StressConfig, np.ndarray, int, int]) -> tuple[np.ndarray, np.ndarray]:
+    cfg, index, chunk, sample = args
+    return count_cells(cfg, grid_model(cfg), index, chunk, sample)
+
+
+def _adapt_shard(args: tuple[StressConfig, np.ndarray, float, int, int]) -> tuple[np.ndarray, np.ndarray]:
+    cfg, index, half_width, max_T, batch = args
+    return adapt_cells(cfg, grid_model(cfg), index, half_width, max_T, batch)
+
+
+def shard_index(num_cells: int, workers: int) -> list[np.ndarray]:
+    """Contiguous grid-order shards, a few per worker for load balance."""
+    parts = min(num_cells, max(1, workers) * 4)
+    return [s for s in np.array_split(np.arange(num_cells), parts) if len(s)]
+
+
+def draw_grid(cfg: StressConfig, model: dict[str, np.ndarray], workers: int = 1,
+              index: np.ndarray | None = None) -> np.ndarray:
+    """draw_cells over the grid (or the cells in `index`), optionally sharded across worker processes."""
+    if index is None:
+        index = np.arange(len(model["prob"]))
+    if workers <= 1 or len(index) == 0:
+        return draw_cells(cfg, model, index)
+    shards = [index[s] for s in shard_index(len(index), workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_draw_shard, [(cfg, s) for s in shards]))
+    return np.concatenate(parts, axis=0)
+
+
+def count_grid(cfg: StressConfig, model: dict[str, np.ndarray], workers: int = 1,
+               chunk: int = CHUNK, sample: int = 0,
+               index: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """count_cells over the grid (or the cells in `index`), optionally sharded across worker processes."""
+    if index is None:
+        index = np.arange(len(model["prob"]))
+    if workers <= 1 or len(index) == 0:
+        return count_cells(cfg, model, index, chunk, sample)
+    shards = [index[s] for s in shard_index(len(index), workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_count_shard, [(cfg, s, chunk, sample) for s in shards]))
+    return (np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts], axis=0))
+
+
+def adapt_grid(cfg: StressConfig, model: dict[str, np.ndarray], workers: int = 1,
+               half_width: float = 0.01, max_T: int = 100_000, batch: int = 0,
+               index: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """adapt_cells over the grid (or the cells in `index`), optionally sharded across worker processes."""
+    if index is None:
+        index = np.arange(len(model["prob"]))
+    if workers <= 1 or len(index) == 0:
+        return adapt_cells(cfg, model, index, half_width, max_T, batch)
+    shards = [index[s] for s in shard_index(len(index), workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_adapt_shard, [(cfg, s, half_width, max_T, batch) for s in shards]))
+    return (np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts]))
+
+
+def wilson_ci(k_succ: int, n_tot: int, z: float = 1.96):
+    """Wilson CI for binomial proportion: (p_hat, low, high)."""
+    p_lo_hi = wilson_ci_array(np.asarray([k_succ]), np.asarray([n_tot]), z)
+    return tuple(float(v[0]) for v in p_lo_hi)
+
+
+def wilson_ci_array(k_succ: np.ndarray, n_tot: np.ndarray, z: float = 1.96):
+    """Vectorized wilson_ci; same operation order as the scalar notebook version."""
+    k_succ = np.asarray(k_succ)
+    n_tot = np.asarray(n_tot)
+    empty = n_tot == 0
+    n_safe = np.where(empty, 1, n_tot)
+    p_hat = k_succ / n_safe
+    denom = 1 + z*z/n_safe
+    center = (p_hat + z*z/(2*n_safe)) / denom
+    half = (z * np.sqrt((p_hat*(1-p_hat) + z*z/(4*n_safe)) / n_safe)) / denom
+    low = np.maximum(0.0, center - half)
+    high = np.minimum(1.0, center + half)
+    zero = np.zeros_like(p_hat)
+    return (np.where(empty, zero, p_hat), np.where(empty, zero, low), np.where(empty, zero, high))
+
+
+@functools.lru_cache(maxsize=None)
+def _pairwise_repeat(v: float, n: int) -> float:
+    # numpy's pairwise_sum over n copies of v: <8 sequential, <=128 eight
+    # unrolled accumulators, otherwise split at an 8-aligned midpoint
+    if n < 8:
+        res = 0.0
+        for _ in range(n):
+            res += v
+        return res
+    if n <= 128:
+        r = [v] * 8
+        for _ in range(8, n - n % 8, 8):
+            r = [x + v for x in r]
+        res = ((r[0] + r[1]) + (r[2] + r[3])) + ((r[4] + r[5]) + (r[6] + r[7]))
+        for _ in range(n % 8):
+            res += v
+        return res
+    n2 = n // 2
+    n2 -= n2 % 8
+    return _pairwise_repeat(v, n2) + _pairwise_repeat(v, n - n2)
+
+
+def constant_mean(values: np.ndarray, n_tot: np.ndarray) -> np.ndarray:
+    """Mean of n_tot copies of each value, summed like pandas Series.mean (numpy pairwise).
+
+    Reproduces the notebooks' g["collision"].mean() bit for bit without
+    materializing the per-trial column.
+    """
+    return np.array([_pairwise_repeat(float(v), int(N)) / N if N else 0.0
+                     for v, N in zip(values, n_tot)])
+
+
+def raw_frame(experiment: str, model: dict[str, np.ndarray], passes: np.ndarray) -> pd.DataFrame:
+    """Per-trial rows (cell-major, trial-minor) in the notebook column layout."""
+    num_cells, T = passes.shape
+    cols = {key: np.repeat(model[key], T) for key in KEYS}
+    cols["trial"] = np.tile(np.arange(T, dtype=np.int64), num_cells)
+    if experiment == "stress_matrix":
+        cols["pass_det"] = np.repeat(model["det"], T)
+        cols["pass_prob"] = passes.ravel().astype(np.int64)
+    elif experiment == "phase_weird":
+        cols["pass_prob"] = passes.ravel().astype(np.int64)
+        cols["collision"] = np.repeat(model["collision"], T)
+    else:
+        raise ValueError(f"unknown experiment: {experiment}")
+    return pd.DataFrame(cols)
+
+
+def agg_frame(experiment: str, model: dict[str, np.ndarray],
+              n_tot: np.ndarray, s_prob: np.ndarray, exact: np.ndarray | None = None) -> pd.DataFrame:
+    """Per-cell aggregates from trial counts and success counts (+ `exact` flag column if given)."""
+    n_tot = np.asarray(n_tot, dtype=np.int64)
+    p_prob, ci_lo, ci_hi = wilson_ci_array(np.asarray(s_prob, dtype=np.int64), n_tot)
+    cols = {key: model[key] for key in KEYS}
+    cols["N"] = n_tot
+    if experiment == "stress_matrix":
+        cols["pass_rate_det"] = np.broadcast_to(model["det"], n_tot.shape).astype(float)
+        cols["pass_rate_prob"] = p_prob
+        cols["ci_low_prob"] = ci_lo
+        cols["ci_high_prob"] = ci_hi
+    elif experiment == "phase_weird":
+        cols["pass_rate_prob"] = p_prob
+        cols["ci_low_prob"] = ci_lo
+        cols["ci_high_prob"] = ci_hi
+        cols["collision_mean"] = constant_mean(model["collision"], n_tot)
+    else:
+        raise ValueError(f"unknown experiment: {experiment}")
+    if exact is not None:
+        cols["exact"] = exact.astype(np.int64)
+    return pd.DataFrame(cols)
+
+
+def write_config(experiment: str, cfg: StressConfig, out_dir: Path, commit: str | None = None,
+                 sampling: dict | None = None) -> Path:
+    path = Path(out_dir) / CONFIG_NAMES[experiment]
+    data = cfg.to_dict(commit)
+    if sampling is not None:
+        data["adaptive"] = sampling
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+    return path
+
+
+def run_sweep(cfg: StressConfig, out_dir: Path, experiments=EXPERIMENTS,
+              commit: str | None = None, workers: int = 1, mode: str = "raw",
+              raw_sample: int = 0, chunk: int = CHUNK, store=None,
+              formats=("csv",), half_width: float = 0.01, max_T: int = 100_000,
+              batch: int = 0, exact: bool = False) -> dict[str, tuple[pd.DataFrame | None, pd.DataFrame]]:
+    """Draw the grid once and write the outputs plus config yaml for each experiment.
+
+    mode="raw" writes <experiment>_raw.csv and _agg.csv; mode="agg" streams
+    the trials, writes only _agg.csv and, if raw_sample > 0, the first
+    raw_sample trials per cell to <experiment>_raw_sample.csv; mode="adaptive"
+    writes only _agg.csv with per-cell N from adapt_grid.
+
+    With a ResultStore (psitm.sim.cache), only cells missing from the store
+    are computed and every computed cell is stored. Raw mode stores each
+    cell's trials and reuses only records that have them; agg and adaptive
+    reuse any record with matching parameters. Agg mode with raw_sample
+    draws every cell (it needs their first trials) but still stores them.
+    With exact=True, saturated cells skip sampling and _agg gets an `exact` column.
+    Tables are written once per entry of `formats` (see psitm.sim.columnar).
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown mode: {mode}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if commit is None:
+        commit = git_commit()
+    model = grid_model(cfg)
+    num_cells = len(model["prob"])
+    n_tot = np.full(num_cells, cfg.T, dtype=np.int64)
+    s_prob = np.zeros(num_cells, dtype=np.int64)
+    fixed = saturated(model["prob"]) if exact else np.zeros(num_cells, dtype=bool)
+    sampling = None
+    if mode == "adaptive":
+        sampling = {"half_width": half_width, "max_T": max_T, "batch": batch or cfg.T}
+    hit = np.zeros(num_cells, dtype=bool)
+    passes = None
+    if store is not None and mode == "raw":
+        passes, hit = store.lookup_trials(cfg, model)
+        s_prob[hit] = passes[hit].sum(axis=1)
+    elif store is not None and raw_sample == 0:
+        n_hit, s_hit, hit = store.lookup(cfg, model, sampling)
+        n_tot[hit], s_prob[hit] = n_hit[hit], s_hit[hit]
+    todo = np.flatnonzero(~hit & ~fixed)
+
+    raw_name = None
+    if mode == "raw":
+        if passes is None:
+            passes = np.empty((num_cells, cfg.T), dtype=bool)
+        passes[todo] = draw_grid(cfg, model, workers, todo)
+        s_prob[todo] = passes[todo].sum(axis=1)
+        raw_name = "raw"
+    elif mode == "adaptive":
+        n_tot[todo], s_prob[todo] = adapt_grid(cfg, model, workers, half_width, max_T, batch, todo)
+    else:
+        s_prob[todo], sample = count_grid(cfg, model, workers, chunk, raw_sample, todo)
+        if raw_sample > 0:
+            passes = np.empty((num_cells, sample.shape[1]), dtype=bool)
+            passes[todo] = sample
+            raw_name = "raw_sample"
+
+    ex = np.flatnonzero(fixed)
+    passing = model["prob"][ex] >= 0.5
+    if mode == "adaptive":
+        n_tot[ex] = [adapt_exact_n(bool(p), half_width, max_T, sampling["batch"]) for p in passing]
+    s_prob[ex] = np.where(passing, n_tot[ex], 0)
+    if passes is not None:
+        passes[ex] = passing[:, None]
+
+    if store is not None:
+        store.save(cfg, model, todo, n_tot[todo], s_prob[todo], sampling,
+                   passes[todo] if mode == "raw" else None)
+    frames: dict[str, tuple[pd.DataFrame | None, pd.DataFrame]] = {}
+    for experiment in experiments:
+        write_config(experiment, cfg, out_dir, commit, sampling)
+        df_raw = None
+        if raw_name:
+            df_raw = raw_frame(experiment, model, passes)
+            for fmt in formats:
+                write_table(df_raw, out_dir / f"{experiment}_{raw_name}", fmt)
+        agg = agg_frame(experiment, model, n_tot, s_prob, fixed if exact else None)
+        for fmt in formats:
+            write_table(agg, out_dir / f"{experiment}_agg", fmt)
+        frames[experiment] = (df_raw, agg)
+    return frames
+
+
+def run_experiment(experiment: str, cfg: StressConfig, out_dir: Path,
+                   commit: str | None = None, workers: int = 1,
+                   mode: str = "raw", formats=("csv",), store=None) -> tuple[pd.DataFrame | None, pd.DataFrame]:
+    """Run one sweep and write <experiment>_raw.csv / _agg.csv plus its config yaml.
+
+    With a ResultStore, cells already in the store are not drawn again (see run_sweep).
+    """
+    return run_sweep(cfg, out_dir, (experiment,), commit, workers, mode, store=store, formats=formats)[experiment]
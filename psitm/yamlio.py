@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+YAML loading shared by the checkers and the stress engine.
+
+- safe_load parses with libyaml's CSafeLoader when PyYAML was built with it
+  and falls back to the pure-Python SafeLoader otherwise; both build the
+  same safe types (str, int, float, bool, None, list, dict, dates)
+- LOADER is the loader in use; scripts/bench_yaml.py times both
+- Dumping stays on PyYAML's Python dumper so written configs do not change
+"""
+from __future__ import annotations
+
+import yaml  # type: ignore
+
+LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream, loader=None):
+    """yaml.safe_load through LOADER (or the given loader class)."""
+    return yaml.load(stream, Loader=loader or LOADER)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time claims.yaml parsing with PyYAML's pure-Python SafeLoader vs libyaml's CSafeLoader.
+
+Usage:
+  python scripts/bench_yaml.py
+  python scripts/bench_yaml.py --entries 100000 --repeat 3
+
+- Builds a synthetic claims file shaped like paper/claims.yaml (comment line,
+  latex/lean mapping per entry) with --entries entries
+- Parses it --repeat times with each available loader, checks both give the
+  same data, and prints the best time per loader and the speedup
+- psitm.yamlio.LOADER (what the checkers use) is marked with *
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml  # type: ignore
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from psitm.yamlio import LOADER, safe_load  # noqa: E402
+
+
+def synthetic_claims(entries: int) -> str:
+    ns = ("Budget", "Psi", "Lk", "AntiSim", "Lkphase", "Relax")
+    out = ["# Synthetic claims (bench_yaml.py)\n"]
+    for i in range(entries):
+        n = ns[i % len(ns)]
+        out.append(f"\n# claim {i}\n- latex: {n}:lem:claim-{i}\n  lean: {n}:Lemma:Claim{i}\n")
+    return "".join(out)
+
+
+def best_time(text: str, loader, repeat: int) -> tuple[float, object]:
+    best, data = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        data = safe_load(text, loader)
+        best = min(best, time.perf_counter() - t0)
+    return best, data
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark YAML loaders on a synthetic claims file")
+    ap.add_argument("--entries", type=int, default=10_000, help="Claims in the synthetic file")
+    ap.add_argument("--repeat", type=int, default=5, help="Parses per loader (best time is reported)")
+    args = ap.parse_args(argv)
+
+    text = synthetic_claims(args.entries)
+    loaders = [yaml.SafeLoader] + ([yaml.CSafeLoader] if hasattr(yaml, "CSafeLoader") else [])
+    print(f"[BENCH] {args.entries} entries, {len(text) / 1e6:.2f} MB, best of {args.repeat}")
+    times, results = {}, {}
+    for loader in loaders:
+        times[loader], results[loader] = best_time(text, loader, args.repeat)
+        mark = "*" if loader is LOADER else " "
+        print(f"{mark} {loader.__name__:<12} {times[loader] * 1000:10.1f} ms")
+    if len(loaders) == 1:
+        print("[WARN] PyYAML was built without libyaml; CSafeLoader unavailable")
+        return 0
+    py, c = loaders
+    if results[py] != results[c]:
+        print("[ERR] loaders disagree on the parsed data")
+        return 1
+    print(f"[OK] CSafeLoader is {times[py] / times[c]:.1f}x faster; identical data")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
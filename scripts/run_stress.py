@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run the stress_firebreak sweeps (stress_matrix, phase_weird) outside the notebooks.
+
+Usage:
+  python scripts/run_stress.py --workers 8
+  python scripts/run_stress.py --config results/2025-08-28/stress_firebreak/config.yaml
+  python scripts/run_stress.py --mode agg --raw-sample 10   # large T, aggregates only
+  python scripts/run_stress.py --mode adaptive --half-width 0.005 --max-T 1000000
+
+- Grid, T, seed and params come from --config (config.yaml layout) or the notebook defaults
+- Cells are sharded across --workers processes and merged in grid order;
+  outputs are identical for any number of workers
+- --mode agg counts successes per cell on the fly and writes only the _agg.csv
+  files (plus <experiment>_raw_sample.csv with the first --raw-sample trials per cell)
+- --mode adaptive samples each cell in batches until its Wilson CI half-width
+  is <= --half-width or --max-T trials are used; the N column records the trials
+- --exact skips sampling for cells whose logistic prob is saturated (0 or 1 up to
+  float precision), writes their exact aggregates and flags them in an `exact` column
+- Per-cell results are cached in results/.stress_cache/ keyed on the cell
+  params, T, seed and engine version (backfilled from earlier dated folders);
+  every mode then only computes cells that are missing (raw mode needs records
+  that kept their trials; --raw-sample runs bypass the store). --no-cache disables it
+- Writes tables and config yaml files to results/<DATE>/stress_firebreak/ (or --out);
+  --format csv,npy,parquet picks the table formats (npy = memory-mappable .cols/ dirs)
+"""
+from __future__ import annotations
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from psitm.sim.cache import ResultStore, import_results  # noqa: E402
+from psitm.sim.columnar import FORMATS, table_path  # noqa: E402
+from psitm.sim.stress import CHUNK, EXPERIMENTS, MODES, StressConfig, git_commit, run_sweep  # noqa: E402
+
+CACHE_DIR = ROOT / "results" / ".stress_cache"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Run stress_firebreak sweeps")
+    ap.add_argument("--config", default=None, help="config.yaml with grid, T, seed and params")
+    ap.add_argument("--out", default=None, help="Output dir (default results/<DATE>/stress_firebreak)")
+    ap.add_argument("--experiment", choices=[*EXPERIMENTS, "all"], default="all")
+    ap.add_argument("--workers", type=int, default=1, help="Worker processes for the grid cells")
+    ap.add_argument("--mode", choices=MODES, default="raw",
+                    help="raw: per-trial + aggregate CSVs; agg: aggregate CSVs only (O(grid) memory)")
+    ap.add_argument("--raw-sample", type=int, default=0,
+                    help="In agg mode, also dump the first K trials per cell")
+    ap.add_argument("--chunk", type=int, default=CHUNK, help="Trials per cell drawn at once in agg mode")
+    ap.add_argument("--half-width", type=float, default=0.01,
+                    help="Adaptive mode: target Wilson 95%% CI half-width per cell")
+    ap.add_argument("--max-T", type=int, default=100_000, help="Adaptive mode: trial cap per cell")
+    ap.add_argument("--batch", type=int, default=0, help="Adaptive mode: trials per step (default: T)")
+    ap.add_argument("--exact", action="store_true",
+                    help="Exact aggregates for saturated cells (adds an `exact` column)")
+    ap.add_argument("--cache", default=str(CACHE_DIR), help="Per-cell aggregate store")
+    ap.add_argument("--no-cache", action="store_true", help="Recompute every cell; do not read or write the store")
+    ap.add_argument("--format", default="csv", help=f"Comma-separated table formats: {','.join(FORMATS)}")
+    args = ap.parse_args(argv)
+
+    if args.config:
+        cfg_path = Path(args.config)
+        if not cfg_path.exists():
+            print(f"[ERR] Missing config: {cfg_path}")
+            return 1
+        cfg = StressConfig.load(cfg_path)
+    else:
+        cfg = StressConfig()
+    out_dir = Path(args.out) if args.out else ROOT / "results" / date.today().isoformat() / "stress_firebreak"
+    experiments = EXPERIMENTS if args.experiment == "all" else (args.experiment,)
+
+    formats = [f.strip() for f in args.format.split(",") if f.strip()]
+    bad = [f for f in formats if f not in FORMATS]
+    if bad or not formats:
+        print(f"[ERR] Unknown format(s): {bad or args.format}; choose from {', '.join(FORMATS)}")
+        return 1
+    if args.raw_sample and args.mode != "agg":
+        print("[ERR] --raw-sample requires --mode agg")
+        return 1
+    if args.mode == "adaptive" and (args.half_width <= 0 or args.max_T <= 0):
+        print("[ERR] --half-width and --max-T must be positive")
+        return 1
+
+    store = None
+    if not args.no_cache:
+        store = ResultStore(Path(args.cache))
+        added = import_results(store, ROOT / "results")
+        if added:
+            print(f"[OK] Imported {added} cached cells from earlier results")
+
+    frames = run_sweep(cfg, out_dir, experiments, commit=git_commit(ROOT), workers=args.workers,
+                       mode=args.mode, raw_sample=args.raw_sample, chunk=args.chunk, store=store,
+                       formats=formats, half_width=args.half_width, max_T=args.max_T, batch=args.batch,
+                       exact=args.exact)
+    if args.mode == "adaptive":
+        agg = frames[experiments[0]][1]
+        print(f"[OK] Adaptive: {int(agg['N'].sum())} trials over {len(agg)} cells "
+              f"(fixed max-T would use {args.max_T * len(agg)})")
+    raw_name = "raw" if args.mode == "raw" else "raw_sample"
+    for experiment in experiments:
+        for fmt in formats:
+            if frames[experiment][0] is not None:
+                print(f"[OK] Wrote {table_path(out_dir / f'{experiment}_{raw_name}', fmt)}")
+            print(f"[OK] Wrote {table_path(out_dir / f'{experiment}_agg', fmt)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trace the pass-probability contours of the stress_firebreak budget model.
+
+Usage:
+  python scripts/trace_boundary.py
+  python scripts/trace_boundary.py --levels 0.1,0.5,0.9 --points 129
+  python scripts/trace_boundary.py --axis extra --config results/2025-08-28/stress_firebreak/config.yaml
+
+- k, the mesh span and the params (c, a, gamma, alpha) come from --config or the notebook defaults
+- For each k and each point of a --points x --points mesh over the other two axes
+  (n log2-uniform), bisects --axis (d or extra) within [--lo, --hi] to --tol
+- Writes phase_boundary.csv (or --format) and phase_boundary_config.yaml to
+  results/<DATE>/stress_firebreak/ (or --out); unbracketed points are NaN
+"""
+from __future__ import annotations
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from psitm.sim.boundary import AXES, BOUNDS, TABLE_NAME, write_boundary  # noqa: E402
+from psitm.sim.columnar import FORMATS, table_path  # noqa: E402
+from psitm.sim.stress import StressConfig, git_commit  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Trace stress_firebreak phase boundaries")
+    ap.add_argument("--config", default=None, help="config.yaml with grid and params")
+    ap.add_argument("--out", default=None, help="Output dir (default results/<DATE>/stress_firebreak)")
+    ap.add_argument("--axis", choices=AXES, default="d", help="Axis solved for by bisection")
+    ap.add_argument("--levels", default="0.5", help="Comma-separated pass-probability levels in (0, 1)")
+    ap.add_argument("--points", type=int, default=65, help="Mesh points per continuous axis")
+    ap.add_argument("--lo", type=float, default=BOUNDS[0], help="Lower bisection bracket")
+    ap.add_argument("--hi", type=float, default=BOUNDS[1], help="Upper bisection bracket")
+    ap.add_argument("--tol", type=float, default=1e-9, help="Bracket width at which bisection stops")
+    ap.add_argument("--format", default="csv", help=f"Comma-separated table formats: {','.join(FORMATS)}")
+    args = ap.parse_args(argv)
+
+    if args.config:
+        cfg_path = Path(args.config)
+        if not cfg_path.exists():
+            print(f"[ERR] Missing config: {cfg_path}")
+            return 1
+        cfg = StressConfig.load(cfg_path)
+    else:
+        cfg = StressConfig()
+    out_dir = Path(args.out) if args.out else ROOT / "results" / date.today().isoformat() / "stress_firebreak"
+
+    formats = [f.strip() for f in args.format.split(",") if f.strip()]
+    bad = [f for f in formats if f not in FORMATS]
+    if bad or not formats:
+        print(f"[ERR] Unknown format(s): {bad or args.format}; choose from {', '.join(FORMATS)}")
+        return 1
+    try:
+        levels = [float(p) for p in args.levels.split(",") if p.strip()]
+    except ValueError:
+        print(f"[ERR] Bad --levels: {args.levels}")
+        return 1
+    if not levels or not all(0.0 < p < 1.0 for p in levels):
+        print(f"[ERR] --levels must lie in (0, 1): {args.levels}")
+        return 1
+    if args.points < 1 or args.tol <= 0 or args.lo >= args.hi:
+        print("[ERR] Need --points >= 1, --tol > 0 and --lo < --hi")
+        return 1
+
+    df = write_boundary(cfg, out_dir, commit=git_commit(ROOT), axis=args.axis, levels=levels,
+                        points=args.points, bounds=(args.lo, args.hi), tol=args.tol, formats=formats)
+    missing = int(df[args.axis].isna().sum())
+    if missing:
+        print(f"[OK] {missing} of {len(df)} mesh points have no crossing in [{args.lo}, {args.hi}]")
+    for fmt in formats:
+        print(f"[OK] Wrote {table_path(out_dir / TABLE_NAME, fmt)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""psitm.antisim.budget against the direct ratio n^beta * B(k-1,n)/B(k,n)."""
+import math
+
+import numpy as np
+import pytest
+
+from psitm.antisim.budget import budget_table, log2_ratio, ratio_grid, threshold_beta, threshold_table, write_budget
+
+KS = [2, 3, 5, 10**6]
+LOG2_NS = [1.0, 10.0, 64.0, 200.0]
+BETAS = [0.0, 0.01, 0.5, 1.0]
+
+
+def direct_ratio(k: int, n: float, beta: float, c: float = 3.0) -> float:
+    def budget(d):
+        return c * d * math.log2(n)
+    return n ** beta * budget(k - 1) / budget(k)
+
+
+def test_grid_matches_direct_formula():
+    grid = ratio_grid(KS, LOG2_NS, BETAS)
+    assert grid.shape == (len(KS), len(LOG2_NS), len(BETAS))
+    for i, k in enumerate(KS):
+        for j, log2_n in enumerate(LOG2_NS[:3]):  # 2^200 ** beta overflows the direct float form
+            for l, beta in enumerate(BETAS):
+                assert 2.0 ** grid[i, j, l] == pytest.approx(direct_ratio(k, 2.0 ** log2_n, beta), rel=1e-12)
+
+
+def test_large_k_keeps_precision():
+    k = 10**12
+    assert ratio_grid([k], [1.0], [0.0])[0, 0, 0] == pytest.approx(-1 / (k * math.log(2)), rel=1e-9)
+
+
+def test_threshold_has_ratio_one():
+    k, log2_n = np.meshgrid(KS, LOG2_NS, indexing="ij")
+    beta = threshold_beta(k, log2_n)
+    assert np.all(beta > 0)
+    assert np.allclose(log2_ratio(k, log2_n, beta), 0.0, atol=1e-12)
+    assert threshold_beta(2, 1.0) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("k, log2_n", [(1, 10.0), (3, 0.0), ([2, 1], 5.0)])
+def test_out_of_range(k, log2_n):
+    with pytest.raises(ValueError):
+        threshold_beta(k, log2_n)
+
+
+def test_tables_in_c_order(tmp_path):
+    grid = budget_table(KS, LOG2_NS, BETAS)
+    assert len(grid) == len(KS) * len(LOG2_NS) * len(BETAS)
+    assert list(grid["k"][:len(LOG2_NS) * len(BETAS)]) == [KS[0]] * (len(LOG2_NS) * len(BETAS))
+    assert np.array_equal(grid["log2_ratio"].to_numpy(), ratio_grid(KS, LOG2_NS, BETAS).ravel())
+    assert np.array_equal(grid["violated"].to_numpy(), (grid["log2_ratio"] >= 0).to_numpy().astype(np.int64))
+
+    thr = threshold_table(KS, LOG2_NS)
+    assert list(thr["k"]) == [k for k in KS for _ in LOG2_NS]
+
+    written, _ = write_budget(tmp_path, KS, LOG2_NS, BETAS)
+    assert written.equals(grid)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "anti_simulation_budget.csv", "anti_simulation_threshold.csv",
+    ]
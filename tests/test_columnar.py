@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""psitm.sim.columnar: compact dtypes and round trips through every format."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from psitm.sim.columnar import (
+    FORMATS, compact, narrow_int_dtype, read_columns, read_table, table_path, write_table,
+)
+
+
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "k": np.array([2, 3, 4], dtype=np.int64),
+        "n": np.array([64, 8192, 2**40], dtype=np.int64),
+        "trial": np.array([0, 1, 299], dtype=np.int64),
+        "exact": np.array([True, False, True]),
+        "pass_rate_prob": np.array([0.1, 1 / 3, np.nextafter(1.0, 0.0)]),
+    })
+
+
+@pytest.mark.parametrize("values, dtype", [
+    ([], np.int8),
+    ([-128, 127], np.int8),
+    ([-129, 0], np.int16),
+    ([0, 32768], np.int32),
+    ([0, 2**31], np.int64),
+    ([-(2**63), 2**63 - 1], np.int64),
+])
+def test_narrow_int_dtype_boundaries(values, dtype):
+    assert narrow_int_dtype(np.array(values, dtype=np.int64)) == np.dtype(dtype)
+
+
+def test_compact_narrows_integers_only():
+    small = compact(frame())
+    assert small["k"].dtype == np.int8
+    assert small["n"].dtype == np.int64
+    assert small["trial"].dtype == np.int16
+    assert small["exact"].dtype == np.bool_
+    assert small["pass_rate_prob"].dtype == np.float64
+    assert (small.to_numpy() == frame().to_numpy()).all()
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_round_trip(tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    df = frame()
+    back = read_table(write_table(df, tmp_path / "t", fmt))
+    assert list(back.columns) == list(df.columns)
+    for name in df.columns:
+        assert np.array_equal(back[name].to_numpy(), df[name].to_numpy()), name
+    assert back["exact"].dtype == np.bool_
+    assert back["pass_rate_prob"].to_numpy().tobytes() == df["pass_rate_prob"].to_numpy().tobytes()
+
+
+def test_npy_columns_are_memory_mapped(tmp_path):
+    cols = read_columns(write_table(frame(), tmp_path / "t", "npy"))
+    assert list(cols) == list(frame().columns)
+    assert all(isinstance(v, np.memmap) for v in cols.values())
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        table_path("t", "xlsx")
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""psitm.proof.dag.ProofDag against brute-force reachability on random graphs."""
+import random
+
+import pytest
+
+from psitm.proof.dag import ProofDag, load_csv, load_dot
+
+
+def reachable(edges: set, n: int) -> list[set]:
+    """reach[a]: every node b with a path a ~> b of length >= 1."""
+    succ = {a: [b for x, b in edges if x == a] for a in range(n)}
+    reach = []
+    for a in range(n):
+        seen, stack = set(), list(succ[a])
+        while stack:
+            x = stack.pop()
+            if x not in seen:
+                seen.add(x)
+                stack.extend(succ[x])
+        reach.append(seen)
+    return reach
+
+
+def assert_valid_order(dag: ProofDag, edges: set):
+    order = dag.topological_order()
+    assert sorted(order) == sorted(dag.ids)
+    pos = {node: p for p, node in enumerate(order)}
+    for a, b in edges:
+        assert pos[str(a)] < pos[str(b)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_order_stays_valid(seed):
+    rng = random.Random(seed)
+    n = 30
+    hidden = list(range(n))
+    rng.shuffle(hidden)
+    pairs = [(hidden[i], hidden[j]) for i in range(n) for j in range(i + 1, n)]
+    dag, edges = ProofDag(), set()
+    for x in range(n):
+        dag.add_node(str(x))
+    dag.topological_order()
+    for a, b in rng.sample(pairs, 120):
+        assert dag.add_edge(str(a), str(b)) is None
+        edges.add((a, b))
+        assert dag._pos is not None  # repaired in place, never recomputed
+        assert_valid_order(dag, edges)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_closing_edge_reports_cycle(seed):
+    rng = random.Random(seed)
+    n = 12
+    dag, edges = ProofDag(), set()
+    for x in range(n):
+        dag.add_node(str(x))
+    dag.topological_order()
+    while True:
+        a, b = rng.randrange(n), rng.randrange(n)
+        closes = a == b or a in reachable(edges, n)[b]
+        cycle = dag.add_edge(str(a), str(b))
+        edges.add((a, b))
+        if not closes:
+            assert cycle is None
+            assert_valid_order(dag, edges)
+            continue
+        # [b, ..., a]: a path of existing edges that a -> b closes
+        assert cycle[0] == str(b) and cycle[-1] == str(a)
+        for x, y in zip(cycle, cycle[1:]):
+            assert (int(x), int(y)) in edges
+        assert dag.topological_order() is None
+        break
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_components_are_mutual_reachability(seed):
+    rng = random.Random(seed)
+    n = 15
+    edges = {(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 30))}
+    dag = ProofDag()
+    for x in range(n):
+        dag.add_node(str(x))
+    for a, b in edges:
+        dag.add_edge(str(a), str(b))
+    reach = reachable(edges, n)
+    expected = {frozenset({a} | {b for b in reach[a] if a in reach[b]}) for a in range(n)}
+    assert {frozenset(int(dag.ids[i]) for i in comp) for comp in dag.components()} == expected
+    cyclic = sorted(sorted(c) for c in expected if len(c) > 1 or next(iter(c)) in reach[next(iter(c))])
+    assert sorted(sorted(int(x) for x in c) for c in dag.cycles()) == cyclic
+    assert (dag.topological_order() is None) == bool(cyclic)
+
+
+def test_components_in_reverse_topological_order():
+    dag = ProofDag()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "B"), ("C", "D")]:
+        dag.add_edge(a, b)
+    assert [sorted(dag.ids[i] for i in comp) for comp in dag.components()] == [["D"], ["B", "C"], ["A"]]
+    assert dag.cycles() == [["B", "C"]]
+
+
+def test_load_csv_and_dot(tmp_path):
+    csv_path = tmp_path / "proof_dag.csv"
+    csv_path.write_text("From,To,Loss\nA,B,1\nB,C,1\nA,B,1\n", encoding="utf-8")
+    dag = load_csv(csv_path)
+    assert dag.topological_order() == ["A", "B", "C"] and dag.n_edges == 2
+
+    dot_path = tmp_path / "deps.gv"
+    dot_path.write_text(
+        'digraph G {\n  "Iso";\n  "A" -> "B" -> "C" [color=red];\n  // "C" -> "A"\n  "C" -> "A";\n}\n',
+        encoding="utf-8",
+    )
+    dag = load_dot(dot_path)
+    assert dag.ids == ["Iso", "A", "B", "C"]
+    assert dag.cycles() == [["A", "B", "C"]]
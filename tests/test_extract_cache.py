@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""psitm.check.cache.ExtractCache invalidation on mtime, size and content changes."""
+import json
+import os
+from pathlib import Path
+
+from psitm.check.cache import CACHE_DIR, EXTRACT_VERSION, ExtractCache, decode_text, tree_cache_dir
+from psitm.check.scan import extract_file
+
+
+class Runner:
+    """run() callback for ExtractCache.extract that records the files it was handed."""
+
+    def __init__(self):
+        self.seen: list[str] = []
+
+    def __call__(self, changed, known):
+        self.seen += [p.name for p in changed]
+        return [extract_file("tex", p, h) for p, h in zip(changed, known)]
+
+
+def write(p: Path, text: str, bump_ns: int = 0) -> Path:
+    p.write_text(text, encoding="utf-8")
+    if bump_ns:
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+    return p
+
+
+def extract(root: Path, paths: list[Path]) -> tuple[dict, ExtractCache, Runner]:
+    cache, run = ExtractCache(root), Runner()
+    records = cache.extract(paths, "tex", run)
+    cache.save()
+    return records, cache, run
+
+
+def test_unchanged_files_are_not_read(tmp_path):
+    a = write(tmp_path / "a.tex", "\\label{A}\n")
+    first, cache, run = extract(tmp_path, [a])
+    assert run.seen == ["a.tex"] and cache.misses == 1
+    again, cache, run = extract(tmp_path, [a])
+    assert again == first and run.seen == [] and cache.misses == 0 and not cache.dirty
+
+
+def test_touch_reuses_record_by_hash(tmp_path):
+    a = write(tmp_path / "a.tex", "\\label{A}\n")
+    first, _, _ = extract(tmp_path, [a])
+    write(a, "\\label{A}\n", bump_ns=10**9)
+    again, cache, run = extract(tmp_path, [a])
+    assert run.seen == ["a.tex"] and cache.misses == 0
+    assert again == first
+    assert cache.entries["a.tex"]["mtime_ns"] == a.stat().st_mtime_ns
+
+
+def test_content_change_is_extracted_again(tmp_path):
+    a = write(tmp_path / "a.tex", "\\label{A}\n")
+    extract(tmp_path, [a])
+    # same size, new content: only the hash can tell
+    write(a, "\\label{B}\n", bump_ns=10**9)
+    records, cache, _ = extract(tmp_path, [a])
+    assert records[a]["labels"] == ["B"] and cache.misses == 1
+    # size change with the mtime kept
+    mtime = a.stat().st_mtime_ns
+    a.write_text("\\label{Longer}\n", encoding="utf-8")
+    os.utime(a, ns=(mtime, mtime))
+    records, cache, _ = extract(tmp_path, [a])
+    assert records[a]["labels"] == ["Longer"] and cache.misses == 1
+
+
+def test_removed_files_are_dropped(tmp_path):
+    a = write(tmp_path / "a.tex", "\\label{A}\n")
+    b = write(tmp_path / "b.tex", "\\label{B}\n")
+    extract(tmp_path, [a, b])
+    b.unlink()
+    _, cache, _ = extract(tmp_path, [a])
+    assert list(cache.entries) == ["a.tex"]
+    assert list(ExtractCache(tmp_path).entries) == ["a.tex"]
+
+
+def test_version_mismatch_discards_index(tmp_path):
+    a = write(tmp_path / "a.tex", "\\label{A}\n")
+    _, cache, _ = extract(tmp_path, [a])
+    data = json.loads(cache.path.read_text(encoding="utf-8"))
+    assert data["version"] == EXTRACT_VERSION
+    data["version"] = EXTRACT_VERSION - 1
+    cache.path.write_text(json.dumps(data), encoding="utf-8")
+    assert ExtractCache(tmp_path).entries == {}
+    cache.path.write_text("not json", encoding="utf-8")
+    assert ExtractCache(tmp_path).entries == {}
+
+
+def test_save_only_when_dirty(tmp_path):
+    a = write(tmp_path / "a.tex", "\\label{A}\n")
+    _, cache, _ = extract(tmp_path, [a])
+    assert cache.path == tmp_path / CACHE_DIR / "index.json"
+    before = cache.path.stat().st_mtime_ns
+    os.utime(cache.path, ns=(before - 10**9, before - 10**9))
+    extract(tmp_path, [a])
+    assert cache.path.stat().st_mtime_ns == before - 10**9
+    assert [p.name for p in cache.path.parent.iterdir()] == ["index.json"]
+
+
+def test_tree_cache_dir_stays_under_home(tmp_path):
+    home, other = tmp_path / "home", tmp_path / "other"
+    assert tree_cache_dir(home, home) == (home / CACHE_DIR).resolve()
+    foreign = tree_cache_dir(other, home)
+    assert foreign.parent == (home / CACHE_DIR / "trees").resolve()
+    assert foreign == tree_cache_dir(other / ".", home)
+    assert foreign != tree_cache_dir(tmp_path / "third", home)
+
+
+def test_decode_text_matches_read_text(tmp_path):
+    p = tmp_path / "a.tex"
+    p.write_bytes(b"caf\xc3\xa9\r\nbad \xff byte\rend")
+    assert decode_text(p.read_bytes()) == p.read_text(encoding="utf-8", errors="ignore")
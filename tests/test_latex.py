@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""psitm.check.latex.tokenize against the strip_comments + regex extraction it replaced."""
+import random
+import re
+
+from psitm.check.latex import comment_starts, tokenize
+from psitm.check.scan import extract_tex
+
+# The pre-tokenizer extraction, kept verbatim as the reference.
+LABEL_RE = re.compile(r"\\label\{([^}]+)\}")
+REF_RE = re.compile(r"\\ref\{([^}]+)\}")
+GRAPHICS_RE = re.compile(r"\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}")
+INCLUDE_RE = re.compile(r"""\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}""", re.MULTILINE)
+GSPATH_RE = re.compile(r"""\\graphicspath\{\s*(\{[^}]+\}\s*)+\}""", re.MULTILINE)
+BRACED_DIR_RE = re.compile(r"""\{([^}]+)\}""")
+
+
+def strip_comments(tex: str) -> str:
+    out = []
+    for line in tex.splitlines():
+        i = 0
+        while True:
+            j = line.find("%", i)
+            if j == -1:
+                out.append(line)
+                break
+            if j > 0 and line[j-1] == "\\":
+                i = j + 1
+                continue
+            out.append(line[:j])
+            break
+    return "\n".join(out)
+
+
+def old_extract_tex(text: str) -> dict:
+    stripped = strip_comments(text)
+    gspaths = []
+    for m in GSPATH_RE.finditer(stripped):
+        for dm in BRACED_DIR_RE.finditer(m.group(0)):
+            raw = dm.group(1).strip()
+            if raw:
+                gspaths.append(raw)
+    return {
+        "labels": LABEL_RE.findall(text),
+        "refs": REF_RE.findall(text),
+        "graphics": GRAPHICS_RE.findall(text),
+        "includes": [m.group(1).strip() for m in INCLUDE_RE.finditer(stripped)],
+        "graphicspaths": gspaths,
+    }
+
+
+COMMANDS = [
+    "\\label{a}", "\\label{b c}", "\\ref{a}", "\\ref{x:y}",
+    "\\includegraphics{fig/p.png}", "\\includegraphics[width=3cm]{ q.pdf }",
+    "\\graphicspath{{fig/}}", "\\graphicspath{ {a/} {b/} }",
+]
+TEXT = ["", " ", "word", "50\\% done", "\\\\", "$x$", "\\section{S}"]
+PIECES = COMMANDS + ["{", "}", "%", "\\%", "\n", "\\label{", "\\includegraphics[", "]", " "]
+
+
+def structured_text(rng: random.Random) -> str:
+    """Lines of whole commands and text, some with a trailing comment holding more commands."""
+    lines = []
+    for _ in range(rng.randint(1, 12)):
+        line = "".join(rng.choice(COMMANDS + TEXT) for _ in range(rng.randint(0, 4)))
+        if rng.random() < 0.4:
+            line += "%" + "".join(rng.choice(COMMANDS + TEXT) for _ in range(rng.randint(0, 3)))
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def test_extract_matches_old_regexes():
+    rng = random.Random(0)
+    for _ in range(500):
+        text = structured_text(rng)
+        assert extract_tex(text) == old_extract_tex(text), text
+
+
+def test_raw_kinds_match_on_any_text():
+    # unbalanced and nested braces, stray % and half commands
+    rng = random.Random(1)
+    for _ in range(500):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 40)))
+        new, old = extract_tex(text), old_extract_tex(text)
+        for kind in ("labels", "refs", "graphics"):
+            assert new[kind] == old[kind], text
+
+
+def test_escaped_percent_is_not_a_comment():
+    text = "\\% \\label{a}\n100\\%% \\label{b}\n%\\label{c}"
+    assert comment_starts(text) == [text.index("%% ") + 1, text.rindex("%")]
+    assert [(t.value, t.line, t.commented) for t in tokenize(text)] == [
+        ("a", 1, False), ("b", 2, True), ("c", 3, True),
+    ]
+
+
+def test_argument_running_into_comment_is_commented():
+    tokens = tokenize("\\includegraphics{a%b}\n\\graphicspath{{x/%\n}{y/}}\n")
+    assert [(t.kind, t.commented) for t in tokens] == [("graphics", True), ("graphicspath", True)]
+    assert extract_tex("\\includegraphics{a%b}")["includes"] == []
+
+
+def test_tokens_in_offset_order():
+    text = "\\ref{r}\\label{l}\n\\includegraphics{g}\\graphicspath{{d/}}"
+    tokens = tokenize(text)
+    assert [t.kind for t in tokens] == ["ref", "label", "graphics", "graphicspath"]
+    assert [t.start for t in tokens] == sorted(t.start for t in tokens)
+    assert all(text.startswith("\\", t.start) for t in tokens)
+    assert [t.line for t in tokens] == [1, 1, 2, 2]
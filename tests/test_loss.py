@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""psitm.proof.loss: exponent/loss algebra, table parsing and propagation over the DAG."""
+import random
+from fractions import Fraction
+
+import pytest
+
+from psitm.proof.dag import ProofDag
+from psitm.proof.loss import BASES, ONE, Exponent, Loss, Mismatch, parse_loss, propagate
+
+
+@pytest.mark.parametrize("a, b", [
+    ("b+e", "e+b"),
+    ("a+b-a", "b"),
+    ("(2α-1)", "α+α-1"),
+    ("1/2+1/2", "1"),
+    ("−1", "-1"),
+    ("3a - a", "2a"),
+])
+def test_exponent_canonical_equality(a, b):
+    assert Exponent.parse(a) == Exponent.parse(b)
+    assert hash(Exponent.parse(a)) == hash(Exponent.parse(b))
+
+
+def test_exponent_zero_is_dropped():
+    e = Exponent.parse("a-a+0")
+    assert not e and e == Exponent() and str(e) == "0"
+    assert Exponent.parse("2a-1/3").terms == (("a", Fraction(2)),)
+    assert Exponent.parse("2a-1/3").const == Fraction(-1, 3)
+
+
+@pytest.mark.parametrize("text", ["", "()", "a,b", "a+", "2*a", "a^2", "+-a"])
+def test_exponent_bad_input(text):
+    with pytest.raises(ValueError):
+        Exponent.parse(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("(log_2 M)^1 × (B(d,n))^-1", {"log2 M": "1", "B(d,n)": "-1"}),
+    ("(d^a)*(k^b)*(log2(n)^a+b)", {"d": "a", "k": "b", "log2 n": "a+b"}),
+    ("$ d^2 × k $", {"d": "2", "k": "1"}),
+    ("d × d^-1", {}),
+    ("1", {}),
+])
+def test_parse_loss_spellings(text, expected):
+    assert parse_loss(text) == Loss({b: Exponent.parse(e) for b, e in expected.items()})
+
+
+@pytest.mark.parametrize("text", ["x^2", "(log_3 n)^1", "$$"])
+def test_parse_loss_rejects_unknown(text):
+    with pytest.raises(ValueError):
+        parse_loss(text)
+
+
+def test_str_round_trips():
+    loss = parse_loss("(d^a)*(k^b)*(log2(n)^a+b)") * parse_loss("(B(d,n))^-1/2")
+    assert parse_loss(str(loss)) == loss
+    assert str(ONE) == "1"
+
+
+def random_loss(rng: random.Random) -> Loss:
+    return Loss({b: Exponent(rng.randint(-2, 2), {s: rng.randint(-2, 2) for s in "ab"})
+                 for b in rng.sample(BASES, rng.randint(0, 3))})
+
+
+def test_mul_div_are_inverse():
+    rng = random.Random(0)
+    for _ in range(200):
+        x, y, z = random_loss(rng), random_loss(rng), random_loss(rng)
+        assert (x * y) / y == x
+        assert x * y == y * x
+        assert (x * y) * z == x * (y * z)
+        assert x / x == ONE and x * ONE == x
+
+
+def diamond(d_loss: str) -> tuple[ProofDag, dict]:
+    # S -> A -> T and S -> B -> T
+    dag = ProofDag()
+    losses = {}
+    for a, b, loss in [("S", "A", "d"), ("A", "T", "k"), ("S", "B", "k"), ("B", "T", d_loss)]:
+        dag.add_edge(a, b)
+        losses[(a, b)] = parse_loss(loss)
+    return dag, losses
+
+
+def test_parallel_paths_agree():
+    canonical, mismatches = propagate(*diamond("d"))
+    assert mismatches == []
+    assert canonical["T"] == ("S", parse_loss("d × k"))
+
+
+def test_parallel_path_disagrees():
+    canonical, mismatches = propagate(*diamond("d^2"))
+    assert canonical["T"] == ("S", parse_loss("d × k"))
+    assert mismatches == [Mismatch(("B", "T"), parse_loss("d^2"), parse_loss("d"), "S")]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_consistent_potentials_never_mismatch(seed):
+    # losses that are ratios of per-node potentials compose the same along every path
+    rng = random.Random(seed)
+    n = 25
+    potential = [random_loss(rng) for _ in range(n)]
+    dag, losses = ProofDag(), {}
+    for _ in range(60):
+        a, b = sorted(rng.sample(range(n), 2))
+        dag.add_edge(str(a), str(b))
+        losses[(str(a), str(b))] = potential[b] / potential[a]
+    canonical, mismatches = propagate(dag, losses)
+    assert mismatches == []
+    for node, (source, loss) in canonical.items():
+        assert loss == potential[int(node)] / potential[int(source)]
+
+
+def test_unlabelled_edges_and_cycles():
+    dag = ProofDag()
+    dag.add_edge("S", "A")
+    dag.add_edge("A", "B")
+    canonical, _ = propagate(dag, {("A", "B"): parse_loss("d")})
+    assert canonical == {"S": ("S", ONE)}
+    dag.add_edge("B", "A")
+    with pytest.raises(ValueError):
+        propagate(dag, {})
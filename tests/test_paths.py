@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""psitm.check.paths.DirCache against Path.exists()/Path.resolve()."""
+import os
+from pathlib import Path
+
+from psitm.check.paths import DirCache
+
+
+def make_tree(root: Path) -> Path:
+    (root / "fig" / "sub").mkdir(parents=True)
+    (root / "fig" / "a.png").write_bytes(b"")
+    (root / "fig" / "sub" / "b.pdf").write_bytes(b"")
+    (root / "note.txt").write_text("x", encoding="utf-8")
+    os.symlink(root / "fig" / "a.png", root / "fig" / "link.png")
+    os.symlink(root / "fig" / "gone.png", root / "fig" / "dangling.png")
+    os.symlink(root / "fig", root / "figlink")
+    return root
+
+
+def candidates(root: Path) -> list[Path]:
+    names = ["a.png", "A.PNG", "link.png", "dangling.png", "gone.png", "sub", "sub/b.pdf", "sub/../a.png", ".."]
+    return [base / name
+            for base in (root / "fig", root / "figlink", root / "missing", root / "note.txt", root / "fig" / ".")
+            for name in names]
+
+
+def test_matches_path_syscalls(tmp_path):
+    root = make_tree(tmp_path)
+    cache = DirCache()
+    for p in candidates(root):
+        assert cache.exists(p) == p.exists(), p
+        assert cache.resolve(p) == p.resolve(), p
+
+
+def test_one_listing_per_directory(tmp_path):
+    root = make_tree(tmp_path)
+    cache = DirCache()
+    for _ in range(3):
+        for name in ("a.png", "b.png", "c.png", "sub"):
+            cache.exists(root / "fig" / name)
+    assert cache.listed == 1
+
+
+def test_case_only_match_falls_back_to_syscall(tmp_path, monkeypatch):
+    root = make_tree(tmp_path)
+    calls = []
+    real_exists = Path.exists
+
+    def exists(self, *args, **kwargs):
+        calls.append(self.name)
+        return real_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", exists)
+    cache = DirCache()
+    assert cache.exists(root / "fig" / "a.png")
+    assert calls == []
+    # on a case-folding filesystem this file exists; only the syscall can say
+    assert cache.exists(root / "fig" / "A.PNG") == real_exists(root / "fig" / "A.PNG")
+    assert calls == ["A.PNG"]
+    assert cache.exists(root / "fig" / "link.png")
+    assert calls == ["A.PNG", "link.png"]
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""psitm.check.scan: one walk, per-file records and refresh of a fixture tree."""
+import os
+from pathlib import Path
+
+from psitm.check.scan import IGNORED_DIRS, scan_project, shared_index, walk
+
+
+def make_tree(root: Path) -> Path:
+    files = {
+        "main.tex": "\\input{sec/a}\n\\label{Lk:main} see \\ref{Lk:a}\n\\includegraphics{fig/plot.png}\n",
+        "sec/a.tex": "\\label{Lk:a}\n% \\includegraphics{fig/old.png}\n\\graphicspath{{fig/}}\n",
+        "fig/plot.png": "png",
+        "lean/Core.lean": "-- ID: Lk:LB:Main\ntheorem x : True := trivial\n",
+        "lean/Sub/Deep.lean": "-- ID: Lk:deep\n",
+        "build/skip.tex": "\\label{never}\n",
+        ".git/x.tex": "\\label{never}\n",
+    }
+    for rel, text in files.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text, encoding="utf-8")
+    return root
+
+
+def test_walk_matches_rglob_without_ignored_dirs(tmp_path):
+    root = make_tree(tmp_path)
+    expected = [p for p in root.rglob("*")
+                if p.is_file() and not any(part in IGNORED_DIRS for part in p.relative_to(root).parts)]
+    assert sorted(walk(root)) == sorted(expected)
+    assert not any(p.name == "skip.tex" for p in walk(root))
+
+
+def test_records(tmp_path):
+    index = scan_project(make_tree(tmp_path))
+    assert index.labels() == {"Lk:main", "Lk:a"}
+    assert index.refs() == {"Lk:a"}
+    assert sorted(raw for _, raw in index.graphics()) == ["fig/old.png", "fig/plot.png"]
+    includes = [raw for rec in index.tex.values() for raw in rec["includes"]]
+    assert includes == ["fig/plot.png"]  # the commented one is only a raw graphics hit
+    assert index.lean_ids() == {"Lk:LB:Main", "Lk:deep"}
+    assert index.lean_ids(recursive=False) == {"Lk:LB:Main"}
+    assert [p.name for p in index.images([".png"])] == ["plot.png"]
+
+
+def test_jobs_do_not_change_records(tmp_path):
+    root = make_tree(tmp_path)
+    assert scan_project(root, jobs=2).tex == scan_project(root).tex
+
+
+def test_shared_index_is_memoized(tmp_path):
+    root = make_tree(tmp_path)
+    assert shared_index(root) is shared_index(root / ".")
+    assert shared_index(root) is not shared_index(root, lean_dir="other")
+
+
+def test_refresh_reports_added_changed_and_removed(tmp_path):
+    root = make_tree(tmp_path)
+    index = scan_project(root)
+    assert index.labels() == {"Lk:main", "Lk:a"}
+    assert index.refresh() == []
+
+    (root / "sec/b.tex").write_text("\\label{Lk:b}\n", encoding="utf-8")
+    a = root / "sec/a.tex"
+    a.write_text("\\label{Lk:a2}\n", encoding="utf-8")
+    os.utime(a, ns=(a.stat().st_atime_ns, a.stat().st_mtime_ns + 10**9))
+    (root / "main.tex").unlink()
+    changed = index.refresh()
+    assert sorted(p.name for p in changed) == ["a.tex", "b.tex", "main.tex"]
+    assert index.labels() == {"Lk:a2", "Lk:b"}
+    assert "lean" not in index.__dict__  # kinds never loaded are left alone
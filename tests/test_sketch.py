@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""psitm.lk.sketch.HyperLogLog error bounds and psitm.lk.transcript.class_census."""
+import numpy as np
+import pytest
+
+from psitm.lk.sketch import HyperLogLog, _bit_length
+from psitm.lk.transcript import (
+    class_census, class_distribution, count_distinct, generate_snapshots, pack_snapshots, transcript_hashes,
+)
+
+
+def random_hashes(n: int, seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 2**64, size=n, dtype=np.uint64)
+
+
+def test_bit_length_is_exact():
+    values = [0, 1, 2, 3, 2**31, 2**32 - 1, 2**32, 2**53 + 1, 2**63, 2**64 - 1]
+    got = _bit_length(np.array(values, dtype=np.uint64))
+    assert [int(b) for b in got] == [v.bit_length() for v in values]
+
+
+@pytest.mark.parametrize("n", [100, 5_000, 200_000])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_estimate_within_four_standard_errors(n, seed):
+    sketch = HyperLogLog(14)
+    sketch.add(random_hashes(n, seed))
+    se = 1.04 / np.sqrt(1 << 14)
+    assert abs(sketch.estimate() - n) <= 4 * se * n
+
+
+def test_duplicates_do_not_count():
+    h = random_hashes(10_000, 3)
+    once, twice = HyperLogLog(12), HyperLogLog(12)
+    once.add(h)
+    twice.add(h)
+    twice.add(h[::-1])
+    assert np.array_equal(once.registers, twice.registers)
+
+
+def test_merge_is_union():
+    a, b = random_hashes(20_000, 4), random_hashes(20_000, 5)
+    left, right, both = HyperLogLog(12), HyperLogLog(12), HyperLogLog(12)
+    left.add(a)
+    right.add(b)
+    both.add(np.concatenate([a, b]))
+    left.merge(right)
+    assert np.array_equal(left.registers, both.registers)
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(10))
+
+
+def test_register_count_bounds():
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+    with pytest.raises(ValueError):
+        HyperLogLog(19)
+
+
+def snapshot_words(m: int, k: int = 3, seed: int = 7):
+    snapshots, ell = generate_snapshots(m, k, np.random.default_rng(seed))
+    return pack_snapshots(snapshots), ell
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_exact_census_matches_brute_force(depth):
+    words, ell = snapshot_words(32)
+    counts, exact = class_census(words, ell, depth)
+    assert exact.all()
+    variants = np.arange(1 << ell, dtype=np.uint64)
+    for q in range(words.shape[1]):
+        assert counts[q] == count_distinct(transcript_hashes(words, [q], depth, variants))
+
+
+def test_census_measures_phase_lock():
+    words, ell = snapshot_words(64)
+    assert class_distribution(class_census(words, ell, 2)[0]) == {1: 64}
+    assert class_distribution(class_census(words, ell, 3)[0]) == {1 << ell: 64}
+
+
+def test_sketched_census_close_to_exact():
+    words, ell = snapshot_words(1 << 12)
+    qs = [0, 17, 4095]
+    exact, _ = class_census(words, ell, 3, qs)
+    sketched, flags = class_census(words, ell, 3, qs, exact_limit=1, batch=1 << 10)
+    assert not flags.any()
+    assert np.all(np.abs(sketched - exact) <= 0.05 * exact)
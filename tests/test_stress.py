@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""psitm.sim.stress against the per-trial notebook loop it replaced."""
+import numpy as np
+import pytest
+
+from psitm.sim.stress import (
+    KEYS, StressConfig, agg_frame, count_cells, draw_cells, draw_grid, grid_model, stable_rng,
+)
+
+CFG = StressConfig(k=(2, 3), d=(1, 3), extra=(1, 4), n=(64, 4096), T=50)
+
+
+def loop_passes(cfg: StressConfig) -> np.ndarray:
+    """The notebooks' scalar loop: one rng.random() per trial."""
+    model = grid_model(cfg)
+    out = np.empty((len(model["prob"]), cfg.T), dtype=bool)
+    for i in range(len(model["prob"])):
+        rng = stable_rng(cfg.seed, *(int(model[key][i]) for key in KEYS))
+        for t in range(cfg.T):
+            out[i, t] = rng.random() < model["prob"][i]
+    return out
+
+
+def test_batched_draws_match_scalar_loop():
+    assert np.array_equal(draw_cells(CFG, grid_model(CFG)), loop_passes(CFG))
+
+
+def test_workers_do_not_change_draws():
+    model = grid_model(CFG)
+    assert np.array_equal(draw_grid(CFG, model, workers=2), draw_grid(CFG, model, workers=1))
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 50, 1 << 16])
+def test_chunked_counts_match_draws(chunk):
+    model = grid_model(CFG)
+    passes = draw_cells(CFG, model)
+    counts, head = count_cells(CFG, model, chunk=chunk, sample=5)
+    assert np.array_equal(counts, passes.sum(axis=1))
+    assert np.array_equal(head, passes[:, :5])
+
+
+def test_agg_frame_with_empty_cell():
+    model = grid_model(CFG)
+    n_tot = np.full(len(model["prob"]), CFG.T, dtype=np.int64)
+    n_tot[0] = 0
+    agg = agg_frame("stress_matrix", model, n_tot, np.zeros_like(n_tot))
+    assert not agg["pass_rate_det"].isna().any()
+    assert np.array_equal(agg["pass_rate_det"].to_numpy(), model["det"].astype(float))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""psitm.sim.cache.ResultStore: cached cells reproduce uncached sweeps exactly."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+import psitm.sim.stress as stress
+from psitm.sim.cache import ResultStore, cell_key
+from psitm.sim.stress import KEYS, StressConfig, grid_model, run_sweep, stable_rng
+
+CFG = StressConfig(k=(2, 3), d=(1, 3), extra=(1, 4), n=(64, 4096), T=50)
+
+
+def test_cell_key_depends_on_every_parameter():
+    cell = (2, 1, 1, 64)
+    base = cell_key(CFG, cell)
+    assert cell_key(CFG, cell) == base
+    assert cell_key(CFG, (2, 1, 1, 128)) != base
+    assert cell_key(replace(CFG, T=51), cell) != base
+    assert cell_key(replace(CFG, seed=1), cell) != base
+    assert cell_key(replace(CFG, alpha=2.0), cell) != base
+    assert cell_key(CFG, cell, {"half_width": 0.01, "max_T": 100, "batch": 50}) != base
+
+
+@pytest.mark.parametrize("mode", ["raw", "agg"])
+def test_store_reuse_is_exact(tmp_path, mode):
+    store = ResultStore(tmp_path / "store")
+    fresh = run_sweep(CFG, tmp_path / "fresh", ("stress_matrix",), commit="x", mode=mode)
+    cold = run_sweep(CFG, tmp_path / "cold", ("stress_matrix",), commit="x", mode=mode, store=store)
+    warm = run_sweep(CFG, tmp_path / "warm", ("stress_matrix",), commit="x", mode=mode, store=store)
+    for name in ("stress_matrix_agg.csv", "stress_matrix_raw.csv"):
+        if (tmp_path / "fresh" / name).exists():
+            expected = (tmp_path / "fresh" / name).read_bytes()
+            assert (tmp_path / "cold" / name).read_bytes() == expected
+            assert (tmp_path / "warm" / name).read_bytes() == expected
+    assert fresh["stress_matrix"][1].equals(warm["stress_matrix"][1])
+    assert cold["stress_matrix"][1].equals(warm["stress_matrix"][1])
+
+
+def test_raw_mode_skips_stored_cells(tmp_path, monkeypatch):
+    store = ResultStore(tmp_path / "store")
+    run_sweep(CFG, tmp_path / "a", ("stress_matrix",), commit="x", store=store)
+    drawn = []
+    real = stress.draw_grid
+
+    def counting_draw_grid(cfg, model, workers=1, index=None):
+        drawn.append(len(index))
+        return real(cfg, model, workers, index)
+
+    monkeypatch.setattr(stress, "draw_grid", counting_draw_grid)
+    run_sweep(CFG, tmp_path / "b", ("stress_matrix",), commit="x", store=store)
+    assert drawn == [0]
+
+
+def test_new_grid_value_draws_only_new_cells(tmp_path):
+    store = ResultStore(tmp_path / "store")
+    run_sweep(CFG, tmp_path / "a", ("stress_matrix",), commit="x", mode="agg", store=store)
+    wider = replace(CFG, n=CFG.n + (256,))
+    hit = store.lookup(wider, grid_model(wider))[2]
+    assert hit.sum() == len(grid_model(CFG)["prob"])
+    assert (~hit).sum() == len(CFG.k) * len(CFG.d) * len(CFG.extra)
+
+
+def test_raw_mode_ignores_count_only_records(tmp_path):
+    store = ResultStore(tmp_path / "store")
+    run_sweep(CFG, tmp_path / "agg", ("stress_matrix",), commit="x", mode="agg", store=store)
+    _, hit = store.lookup_trials(CFG, grid_model(CFG))
+    assert not hit.any()
+    run_sweep(CFG, tmp_path / "raw", ("stress_matrix",), commit="x", store=store)
+    passes, hit = store.lookup_trials(CFG, grid_model(CFG))
+    assert hit.all()
+    model = grid_model(CFG)
+    for i in range(len(model["prob"])):
+        rng = stable_rng(CFG.seed, *(int(model[key][i]) for key in KEYS))
+        assert np.array_equal(passes[i], rng.random(CFG.T) < model["prob"][i])
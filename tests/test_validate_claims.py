@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""scripts/validate_claims.py invoked the way the CI workflows invoke it."""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_script(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "scripts/validate_claims.py", *args],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+
+
+def test_claims_path_as_ci_passes_it():
+    proc = run_script("paper/claims.yaml", "--no-cache")
+    assert "unrecognized arguments" not in proc.stderr
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "[OK] claims.yaml is valid" in proc.stdout
+
+
+def test_claims_path_defaults_to_paper_claims():
+    proc = run_script("--no-cache")
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+
+def test_missing_claims_path_fails():
+    proc = run_script("paper/no-such-claims.yaml", "--no-cache")
+    assert proc.returncode == 1
+    assert "[ERR] Missing claims file" in proc.stdout